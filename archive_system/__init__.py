@@ -1,15 +1,27 @@
 from flask import Flask
-from werkzeug.security import generate_password_hash
+from werkzeug.middleware.proxy_fix import ProxyFix
 from .config import Config
-from .extensions import db
-from .models import Admin, SystemConfig, Announcement
+from .extensions import db, init_sqlite_pragmas
+from . import assets, live, metrics, notify
+from .cache import cached_fragment
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
 
+    # 反向代理之后按受信任的层数还原客户端 IP 与协议（按 IP 限流使用 request.remote_addr）
+    hops = app.config.get("PROXY_FIX_HOPS", 0)
+    if hops:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops, x_host=hops)
+
     # 初始化扩展
     db.init_app(app)
+    init_sqlite_pragmas(app)
+    notify.init_app(app)
+    live.init_app(app)
+    assets.init_app(app)
+    app.add_template_global(cached_fragment)
+    metrics.init_app(app)
 
     # 注册蓝图
     from .routes.h5 import h5_bp
@@ -17,15 +29,24 @@ def create_app(config_class=Config):
     app.register_blueprint(h5_bp)
     app.register_blueprint(admin_bp)
 
-    # 初始化数据库（仅用于开发环境，生产环境应使用 Flask-Migrate）
-    with app.app_context():
-        db.create_all()
-        init_data()
+    # 注册命令行工具
+    from .commands import register_commands
+    register_commands(app)
 
+    # 建表与默认数据不在这里执行：每个 worker / 每个测试创建应用时都不访问数据库。
+    # 首次部署执行 `flask init-db`，已有数据库升级执行 `flask upgrade-db`。
     return app
 
+def init_db():
+    """建表并写入默认数据（flask init-db 及开发服务器启动时调用）"""
+    db.create_all()
+    init_data()
+
 def init_data():
     """初始化默认数据"""
+    from werkzeug.security import generate_password_hash
+    from .models import Admin, SystemConfig, Announcement
+
     # 创建默认管理员
     if not Admin.query.filter_by(username="admin").first():
         admin = Admin(
@@ -0,0 +1,115 @@
+"""
+历史预约归档
+参观日期早于归档期限（ARCHIVE_HORIZON_DAYS）的预约按批迁入 archived_reservation 表，
+成员名单与签到时间随之迁移，同期的名额台账与候补记录直接删除，
+热表只保留近期与未来的预约，管理端列表、计数与唯一索引都保持小而稳定。
+统计汇总表不受影响（仍覆盖全部历史）；H5 历史记录与导出按需合并读取归档数据。
+"""
+from datetime import date, datetime, timedelta
+from sqlalchemy import delete, func, insert, literal, select, update
+from .extensions import db
+from .counters import bump_status
+from .models import (
+    ArchivedReservation, ArchivedReservationMember, CheckIn, NotificationOutbox,
+    Reservation, ReservationMember, SlotCapacity, WaitlistEntry,
+)
+
+# 与热表同名、直接复制的列
+COPY_COLUMNS = (
+    "id", "user_id", "area", "visit_date", "visit_time", "reason",
+    "res_type", "identity", "status", "reject_reason", "created_at",
+)
+
+def archive_cutoff(horizon_days, today=None):
+    """参观日期早于该日期的预约会被归档"""
+    return (today or date.today()) - timedelta(days=horizon_days)
+
+def _archive_batch(ids, now):
+    """在当前事务中迁移一批预约及其关联数据"""
+    source = (
+        select(
+            *(getattr(Reservation, name) for name in COPY_COLUMNS),
+            CheckIn.checked_in_at,
+            literal(now).label("archived_at"),
+        )
+        .outerjoin(CheckIn, CheckIn.reservation_id == Reservation.id)
+        .where(Reservation.id.in_(ids))
+    )
+    db.session.execute(
+        insert(ArchivedReservation).from_select(COPY_COLUMNS + ("checked_in_at", "archived_at"), source)
+    )
+    db.session.execute(
+        insert(ArchivedReservationMember).from_select(
+            ("reservation_id", "user_id", "created_at"),
+            select(ReservationMember.reservation_id, ReservationMember.user_id, ReservationMember.created_at)
+            .where(ReservationMember.reservation_id.in_(ids)),
+        )
+    )
+
+    # 状态计数只统计热表中的预约
+    totals = db.session.execute(
+        select(Reservation.status, func.count(Reservation.id))
+        .where(Reservation.id.in_(ids))
+        .group_by(Reservation.status)
+    ).all()
+    for status, count in totals:
+        bump_status(status, -count)
+
+    # 发件箱只保留通知内容、候补记录只保留排队信息，不再引用已归档的预约
+    for model in (NotificationOutbox, WaitlistEntry):
+        db.session.execute(
+            update(model)
+            .where(model.reservation_id.in_(ids))
+            .values(reservation_id=None)
+            .execution_options(synchronize_session=False)
+        )
+    for model, column in (
+        (ReservationMember, ReservationMember.reservation_id),
+        (CheckIn, CheckIn.reservation_id),
+        (Reservation, Reservation.id),
+    ):
+        db.session.execute(delete(model).where(column.in_(ids)).execution_options(synchronize_session=False))
+
+def archive_reservations(horizon_days, batch_size=1000, today=None):
+    """分批归档，每批一个事务，中断后重新执行即可继续；返回归档条数"""
+    cutoff = archive_cutoff(horizon_days, today)
+    total = 0
+    while True:
+        ids = db.session.execute(
+            select(Reservation.id)
+            .where(Reservation.visit_date < cutoff)
+            .order_by(Reservation.id)
+            .limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            break
+        _archive_batch(ids, datetime.now())
+        db.session.commit()
+        total += len(ids)
+
+    # 过去日期的名额台账与候补记录不再需要
+    for model in (SlotCapacity, WaitlistEntry):
+        db.session.execute(delete(model).where(model.visit_date < cutoff))
+    db.session.commit()
+    return total
+
+def user_history(user_id, include_archived=False):
+    """用户的预约记录（按提交时间倒序），include_archived 时合并归档记录"""
+    items = (
+        Reservation.query.filter_by(user_id=user_id)
+        .order_by(Reservation.created_at.desc())
+        .all()
+    )
+    if include_archived:
+        items += (
+            ArchivedReservation.query.filter_by(user_id=user_id)
+            .order_by(ArchivedReservation.created_at.desc())
+            .all()
+        )
+        items.sort(key=lambda item: item.created_at or datetime.min, reverse=True)
+    return items
+
+def has_archived(user_id):
+    return db.session.query(
+        ArchivedReservation.query.filter_by(user_id=user_id).exists()
+    ).scalar()
@@ -0,0 +1,142 @@
+"""
+静态资源构建与长期缓存
+`flask build-assets` 扫描模板中 asset_url('...') 引用的静态文件，按内容哈希生成带指纹的副本
+（static/dist/css/bootstrap.min.<哈希>.css）及 .gz / .br 预压缩文件，并写入 manifest.json；
+加 --prune 时删除 static 下未被模板引用的文件（Bootstrap 的 RTL、ESM、未压缩版本与 source map 等）。
+模板中的 asset_url 输出 /assets/ 下的指纹地址，响应带一年期 immutable 缓存头，并按 Accept-Encoding
+直接返回预压缩文件；文件内容变化后地址随之变化，浏览器无需再向服务端确认缓存是否过期。
+未执行构建（没有 manifest）时回退为普通的 /static 地址。
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+from flask import abort, current_app, request, send_from_directory, url_for
+
+try:
+    import brotli
+except ImportError:  # 可选依赖：未安装时只生成 gzip 副本
+    brotli = None
+
+DIST_DIR = "dist"
+MANIFEST = "manifest.json"
+IMMUTABLE = "public, max-age=31536000, immutable"
+# 模板中的静态资源引用
+REFERENCE_PATTERN = re.compile(r"""asset_url\(\s*['"]([^'"]+)['"]\s*\)""")
+# source map 不随站点发布，构建时去掉文件末尾的引用注释
+SOURCE_MAP_PATTERN = re.compile(rb"\s*/(?:\*|/)# sourceMappingURL=\S+(?: \*/)?\s*$")
+# 预压缩副本：(Content-Encoding, 文件后缀)，按优先级排列
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+def _dist_dir(app):
+    return os.path.join(app.static_folder, DIST_DIR)
+
+def _write(path, content):
+    """先写临时文件再替换，构建期间正在运行的 worker 不会读到半个文件"""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(content)
+    os.replace(tmp, path)
+
+def referenced_assets(app):
+    """模板中通过 asset_url 引用的静态文件（相对 static 目录）"""
+    names = set()
+    for template in app.jinja_env.list_templates():
+        source, _, _ = app.jinja_env.loader.get_source(app.jinja_env, template)
+        names.update(REFERENCE_PATTERN.findall(source))
+    return sorted(names)
+
+def _fingerprint(name, content):
+    root, ext = os.path.splitext(name)
+    return f"{root}.{hashlib.sha256(content).hexdigest()[:12]}{ext}"
+
+def _prune(app, keep):
+    """删除 static 下（dist 除外）未被模板引用的文件，返回删除的文件列表"""
+    removed = []
+    for root, dirs, files in os.walk(app.static_folder):
+        if root == app.static_folder and DIST_DIR in dirs:
+            dirs.remove(DIST_DIR)
+        for filename in files:
+            path = os.path.join(root, filename)
+            name = os.path.relpath(path, app.static_folder).replace(os.sep, "/")
+            if name not in keep:
+                os.remove(path)
+                removed.append(name)
+    return sorted(removed)
+
+def build_assets(app, prune=False):
+    """生成指纹文件、预压缩副本与 manifest，返回 (manifest, 删除的文件列表)"""
+    dist = _dist_dir(app)
+    manifest = {}
+    for name in referenced_assets(app):
+        with open(os.path.join(app.static_folder, name), "rb") as f:
+            content = SOURCE_MAP_PATTERN.sub(b"\n", f.read())
+        hashed = _fingerprint(name, content)
+        path = os.path.join(dist, hashed)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _write(path, content)
+        _write(path + ".gz", gzip.compress(content, 9, mtime=0))
+        if brotli is not None:
+            _write(path + ".br", brotli.compress(content))
+        manifest[name] = hashed
+    # 旧版本的指纹文件保留在 dist 中，滚动发布期间仍持有旧页面的浏览器可以继续加载
+    _write(os.path.join(dist, MANIFEST), json.dumps(manifest, indent=2, sort_keys=True).encode())
+    removed = _prune(app, set(manifest)) if prune else []
+    return manifest, removed
+
+def _load_manifest(app):
+    dist = _dist_dir(app)
+    try:
+        with open(os.path.join(dist, MANIFEST), encoding="utf-8") as f:
+            files = json.load(f)
+    except (OSError, ValueError):
+        files = {}
+    encodings = {
+        hashed: tuple(
+            (encoding, suffix) for encoding, suffix in ENCODINGS
+            if os.path.exists(os.path.join(dist, hashed + suffix))
+        )
+        for hashed in files.values()
+    }
+    return {"files": files, "encodings": encodings}
+
+def get_manifest():
+    """每个进程加载一次（构建后重启 worker 生效）；调试模式下每次重新读取"""
+    manifest = current_app.extensions.get("asset_manifest")
+    if manifest is None or current_app.debug:
+        manifest = _load_manifest(current_app)
+        current_app.extensions["asset_manifest"] = manifest
+    return manifest
+
+def asset_url(filename):
+    """模板中引用静态资源：已构建时返回带指纹的 /assets 地址，否则回退为 /static 地址"""
+    hashed = get_manifest()["files"].get(filename)
+    if hashed is None:
+        return url_for("static", filename=filename)
+    return url_for("assets", filename=hashed)
+
+def serve_asset(filename):
+    """返回指纹文件，客户端支持时直接发送预压缩副本"""
+    encodings = get_manifest()["encodings"].get(filename)
+    if encodings is None:
+        abort(404)
+    accepted = request.accept_encodings
+    encoding, suffix = next(((e, s) for e, s in encodings if accepted[e]), (None, ""))
+
+    response = send_from_directory(
+        _dist_dir(current_app),
+        filename + suffix,
+        mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+        max_age=31536000,
+    )
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    response.headers["Cache-Control"] = IMMUTABLE
+    return response
+
+def init_app(app):
+    app.add_url_rule("/assets/<path:filename>", "assets", serve_asset)
+    app.add_template_global(asset_url)
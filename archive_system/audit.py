@@ -0,0 +1,129 @@
+from collections import Counter
+from sqlalchemy import update
+from .extensions import db
+from .models import Reservation
+from .capacity import release_slot, OCCUPYING_STATUSES
+from .counters import move_status
+from .stats import record_transition
+from .notify import enqueue
+from .waitlist import promote_waiters
+
+PENDING = "待审核"
+CANCELLED = "已取消"
+ACTION_STATUS = {"approve": "已同意", "reject": "已拒绝"}
+
+# 单次批量审核的最大条数
+BATCH_AUDIT_LIMIT = 500
+
+def audit_reservations(res_ids, action, reject_reason=""):
+    """
+    审核预约（单条与批量共用）
+    只用一条条件 UPDATE ... WHERE status='待审核' AND id IN (...) 完成状态流转，
+    多个管理员同时审核同一批预约时，每条记录只会被处理一次。
+    名额释放、候补转正、状态计数与状态更新处于同一事务，由调用方提交。
+    返回: (本次处理的预约列表, {id: (结果, 当前状态)}, 候补转正的新预约列表)，
+    结果为 updated / skipped / not_found
+    """
+    new_status = ACTION_STATUS[action]
+    res_ids = list(dict.fromkeys(res_ids))
+    values = {"status": new_status}
+    if action == "reject":
+        values["reject_reason"] = reject_reason
+        values["active_key"] = None  # 被拒绝后允许重新预约同一时段
+
+    stmt = (
+        update(Reservation)
+        .where(Reservation.status == PENDING, Reservation.id.in_(res_ids))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    columns = (
+        Reservation.id,
+        Reservation.user_id,
+        Reservation.area,
+        Reservation.visit_date,
+        Reservation.visit_time,
+        Reservation.res_type,
+        Reservation.identity,
+    )
+    if db.engine.dialect.update_returning:
+        updated = db.session.execute(stmt.returning(*columns)).all()
+    else:
+        # 不支持 RETURNING 的数据库（如 MySQL）：先锁定待审核记录再更新
+        updated = (
+            db.session.query(*columns)
+            .filter(Reservation.status == PENDING, Reservation.id.in_(res_ids))
+            .with_for_update()
+            .all()
+        )
+        if updated:
+            db.session.execute(stmt.where(Reservation.id.in_([row.id for row in updated])))
+
+    promoted = []
+    if action == "reject":
+        slots = Counter((row.area, row.visit_date, row.visit_time) for row in updated)
+        for (area, visit_date, visit_time), count in slots.items():
+            release_slot(area, visit_date, visit_time, count)
+            promoted += promote_waiters(area, visit_date, visit_time, count)
+    move_status(PENDING, new_status, len(updated))
+    record_transition(updated, PENDING, new_status)
+
+    results = {row.id: ("updated", new_status) for row in updated}
+    skipped_ids = [res_id for res_id in res_ids if res_id not in results]
+    if skipped_ids:
+        current = dict(
+            db.session.query(Reservation.id, Reservation.status)
+            .filter(Reservation.id.in_(skipped_ids))
+            .all()
+        )
+        for res_id in skipped_ids:
+            if res_id in current:
+                results[res_id] = ("skipped", current[res_id])
+            else:
+                results[res_id] = ("not_found", None)
+    return updated, {res_id: results[res_id] for res_id in res_ids}, promoted
+
+def enqueue_audit_notifications(updated, action, reject_reason=""):
+    """为本次审核处理的预约写入通知（与审核结果同一事务）"""
+    for row in updated:
+        if action == "approve":
+            message = "预约已同意。注意事项：请携带身份证入馆。"
+        else:
+            message = f"预约被拒绝。原因：{reject_reason}"
+        enqueue(
+            "approved" if action == "approve" else "rejected",
+            row.user_id,
+            message,
+            reservation_id=row.id,
+        )
+
+def cancel_reservation(res_id, user_id, today):
+    """
+    访客取消自己尚未到期的预约（待审核或已同意）
+    与审核相同，用条件 UPDATE 保证与管理员审核并发时只生效一次；释放名额后同一事务内候补转正。
+    返回: (被取消的预约, 候补转正的新预约列表)，无法取消时返回 (None, [])
+    """
+    res = (
+        Reservation.query.filter_by(id=res_id, user_id=user_id)
+        .with_entities(
+            Reservation.id, Reservation.status, Reservation.area, Reservation.visit_date,
+            Reservation.visit_time, Reservation.res_type, Reservation.identity,
+        )
+        .first()
+    )
+    if res is None or res.status not in OCCUPYING_STATUSES or res.visit_date < today:
+        return None, []
+
+    changed = db.session.execute(
+        update(Reservation)
+        .where(Reservation.id == res.id, Reservation.status == res.status)
+        .values(status=CANCELLED, active_key=None)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not changed:
+        return None, []
+
+    release_slot(res.area, res.visit_date, res.visit_time)
+    move_status(res.status, CANCELLED)
+    record_transition([res], res.status, CANCELLED)
+    return res, promote_waiters(res.area, res.visit_date, res.visit_time)
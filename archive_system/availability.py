@@ -0,0 +1,99 @@
+"""
+时段余量日历
+每个进程在内存中维护未来 N 天各 校区/日期/时段 的已占用名额，
+本进程内的预约提交、审核拒绝会即时更新日历；其他进程的变更通过定期（AVAILABILITY_REFRESH 秒）
+从名额台账重新加载获得。接口返回预先序列化好的 JSON 与 ETag，H5 页面轮询时大多只得到 304。
+"""
+import hashlib
+import json
+import threading
+import time
+from datetime import date, timedelta
+from flask import current_app
+from .models import SlotCapacity
+
+class AvailabilityCalendar:
+
+    def __init__(self, max_days, refresh):
+        self.max_days = max_days
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._booked = {}
+        self._start = None
+        self._loaded_at = 0
+        self._payloads = {}
+
+    def _load(self, today):
+        end = today + timedelta(days=self.max_days)
+        rows = (
+            SlotCapacity.query.with_entities(
+                SlotCapacity.area, SlotCapacity.visit_date, SlotCapacity.visit_time, SlotCapacity.booked
+            )
+            .filter(SlotCapacity.visit_date >= today, SlotCapacity.visit_date < end)
+            .all()
+        )
+        self._booked = {(area, visit_date, visit_time): booked for area, visit_date, visit_time, booked in rows}
+        self._start = today
+        self._loaded_at = time.monotonic()
+        self._payloads.clear()
+
+    def adjust(self, area, visit_date, visit_time, delta):
+        """本进程内名额变化后即时更新日历"""
+        with self._lock:
+            if self._start is None or not (self._start <= visit_date < self._start + timedelta(days=self.max_days)):
+                return
+            key = (area, visit_date, visit_time)
+            self._booked[key] = max(self._booked.get(key, 0) + delta, 0)
+            self._payloads.clear()
+
+    def _build(self, days, config):
+        campuses = config.campuses.split(",") if config.campuses else []
+        times = config.visit_times.split(",") if config.visit_times else []
+        limit = config.daily_limit
+
+        dates = {}
+        for offset in range(days):
+            visit_date = self._start + timedelta(days=offset)
+            dates[visit_date.isoformat()] = {
+                area: {
+                    visit_time: (
+                        None if limit is None
+                        else max(limit - self._booked.get((area, visit_date, visit_time), 0), 0)
+                    )
+                    for visit_time in times
+                }
+                for area in campuses
+            }
+
+        body = json.dumps(
+            {"is_open": bool(config.is_open), "daily_limit": limit, "dates": dates},
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha1(body.encode()).hexdigest(), body
+
+    def snapshot(self, days, config):
+        """返回 (etag, JSON 文本)，内容未变化时直接复用已序列化的结果"""
+        days = max(1, min(days, self.max_days))
+        today = date.today()
+        with self._lock:
+            if self._start != today or time.monotonic() - self._loaded_at > self.refresh:
+                self._load(today)
+            key = (days, config.campuses, config.visit_times, config.daily_limit, config.is_open)
+            if key not in self._payloads:
+                self._payloads[key] = self._build(days, config)
+            return self._payloads[key]
+
+def get_calendar():
+    calendar = current_app.extensions.get("availability_calendar")
+    if calendar is None:
+        calendar = AvailabilityCalendar(
+            current_app.config.get("AVAILABILITY_MAX_DAYS", 30),
+            current_app.config.get("AVAILABILITY_REFRESH", 5),
+        )
+        current_app.extensions["availability_calendar"] = calendar
+    return calendar
+
+def note_slot_change(area, visit_date, visit_time, delta):
+    """预约提交 (+1) 或名额释放 (-n) 的事务提交后调用"""
+    get_calendar().adjust(area, visit_date, visit_time, delta)
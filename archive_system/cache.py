@@ -0,0 +1,108 @@
+"""
+系统配置、公告及管理员凭据的进程内缓存
+配置与公告只在管理员操作 admin.config 时变化，H5 热点页面直接读取缓存快照；
+管理员每次请求的会话校验也从这里读取凭据，无需按主键查询 Admin。
+多进程部署时通过实例目录下的版本文件（mtime）通知其他 worker 失效，检查版本只需一次 os.stat，不访问数据库。
+公告列表、隐私声明等只依赖配置/公告的模板片段也按同样的方式缓存渲染结果。
+"""
+import os
+import time
+from types import SimpleNamespace
+from flask import current_app
+from markupsafe import Markup
+from .models import SystemConfig, Announcement, Admin
+
+def _snapshot(row):
+    """将 ORM 对象转换为与会话无关的只读快照"""
+    return SimpleNamespace(**{c.name: getattr(row, c.name) for c in row.__table__.columns})
+
+def _version_file():
+    return current_app.config.get("CACHE_VERSION_FILE") or os.path.join(
+        current_app.instance_path, "cache_version"
+    )
+
+def _version_stamp():
+    try:
+        return os.stat(_version_file()).st_mtime_ns
+    except OSError:
+        return 0
+
+def _cached(name, loader, max_age=None):
+    store = current_app.extensions.setdefault("archive_cache", {})
+    if max_age is None:
+        max_age = current_app.config.get("CACHE_MAX_AGE", 300)
+    stamp = _version_stamp()
+    now = time.monotonic()
+
+    entry = store.get(name)
+    if entry and entry[0] == stamp and now - entry[1] < max_age:
+        return entry[2]
+
+    value = loader()
+    store[name] = (stamp, now, value)
+    return value
+
+def _load_config():
+    row = SystemConfig.query.first()
+    return _snapshot(row) if row else None
+
+def _load_announcements():
+    rows = Announcement.query.order_by(Announcement.created_at.desc()).all()
+    return [_snapshot(row) for row in rows]
+
+def get_config():
+    """读取系统配置快照（只读，修改配置请查询 SystemConfig 并在提交后调用 invalidate）"""
+    return _cached("config", _load_config)
+
+def get_announcements():
+    """读取公告列表快照（按发布时间倒序）"""
+    return _cached("announcements", _load_announcements)
+
+def _announcements_context():
+    return {"all_announcements": get_announcements()}
+
+def _privacy_policy_context():
+    config = get_config()
+    return {"privacy_policy": config.privacy_policy if config else "<p>暂无内容</p>"}
+
+# 可缓存的模板片段及其渲染数据
+FRAGMENTS = {
+    "fragment_announcements.html": _announcements_context,
+    "fragment_privacy_policy.html": _privacy_policy_context,
+}
+
+def cached_fragment(template_name):
+    """模板中调用：返回片段的渲染结果，随配置/公告缓存一起失效（片段不依赖请求与会话）"""
+    context = FRAGMENTS[template_name]
+    return _cached(
+        f"fragment:{template_name}",
+        lambda: Markup(current_app.jinja_env.get_template(template_name).render(**context())),
+    )
+
+def get_admin_credential(admin_id):
+    """
+    读取管理员会话校验所需的凭据（密码哈希末 6 位）
+    返回: (账号是否存在, 凭据)；缓存时间较短（ADMIN_CREDENTIAL_MAX_AGE），
+    修改/重置密码、删除账号后调用 invalidate 立即生效
+    """
+    credentials = _cached(
+        "admin_credentials", dict, max_age=current_app.config.get("ADMIN_CREDENTIAL_MAX_AGE", 30)
+    )
+    if admin_id not in credentials:
+        admin = Admin.query.get(admin_id) if admin_id is not None else None
+        if admin is None:
+            credentials[admin_id] = (False, None)
+        else:
+            credentials[admin_id] = (True, admin.password_hash[-6:] if admin.password_hash else None)
+    return credentials[admin_id]
+
+def invalidate():
+    """配置、公告或管理员凭据变更后调用：清空本进程缓存，并更新版本文件通知其他进程"""
+    current_app.extensions.get("archive_cache", {}).clear()
+
+    path = _version_file()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(str(time.time_ns()))
+    os.replace(tmp_path, path)
@@ -0,0 +1,74 @@
+from sqlalchemy import update, func, case
+from sqlalchemy.exc import IntegrityError
+from .extensions import db
+from .models import SlotCapacity, Reservation
+
+# 占用名额的预约状态（被拒绝的预约会释放名额）
+OCCUPYING_STATUSES = ("待审核", "已同意")
+
+def _slot_filter(area, visit_date, visit_time):
+    return (
+        SlotCapacity.area == area,
+        SlotCapacity.visit_date == visit_date,
+        SlotCapacity.visit_time == visit_time,
+    )
+
+def _try_increment(area, visit_date, visit_time, limit):
+    stmt = (
+        update(SlotCapacity)
+        .where(*_slot_filter(area, visit_date, visit_time))
+        .values(booked=SlotCapacity.booked + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if limit is not None:
+        stmt = stmt.where(SlotCapacity.booked < limit)
+    return db.session.execute(stmt).rowcount == 1
+
+def acquire_slot(area, visit_date, visit_time, limit):
+    """
+    在当前事务中为指定时段占用一个名额
+    使用条件更新 (booked < limit)，与预约记录在同一事务提交，
+    并发提交时由数据库行锁保证不会超额，无需全局锁或 COUNT(*) 扫描
+    返回: True 占用成功 / False 名额已满
+    """
+    if _try_increment(area, visit_date, visit_time, limit):
+        return True
+
+    # 台账行不存在时先补建；并发补建冲突时忽略，再走一次条件更新
+    if not db.session.query(SlotCapacity.id).filter(*_slot_filter(area, visit_date, visit_time)).first():
+        try:
+            with db.session.begin_nested():
+                db.session.add(SlotCapacity(area=area, visit_date=visit_date, visit_time=visit_time, booked=0))
+        except IntegrityError:
+            pass
+        return _try_increment(area, visit_date, visit_time, limit)
+
+    return False
+
+def release_slot(area, visit_date, visit_time, count=1):
+    """在当前事务中释放名额（预约被拒绝时调用）"""
+    db.session.execute(
+        update(SlotCapacity)
+        .where(*_slot_filter(area, visit_date, visit_time), SlotCapacity.booked > 0)
+        .values(booked=case((SlotCapacity.booked > count, SlotCapacity.booked - count), else_=0))
+        .execution_options(synchronize_session=False)
+    )
+
+def rebuild_capacity():
+    """根据现有预约记录重建名额台账（首次上线或数据修复时使用）"""
+    rows = (
+        db.session.query(
+            Reservation.area,
+            Reservation.visit_date,
+            Reservation.visit_time,
+            func.count(Reservation.id),
+        )
+        .filter(Reservation.status.in_(OCCUPYING_STATUSES), Reservation.area.isnot(None))
+        .group_by(Reservation.area, Reservation.visit_date, Reservation.visit_time)
+        .all()
+    )
+    db.session.query(SlotCapacity).delete()
+    for area, visit_date, visit_time, booked in rows:
+        db.session.add(SlotCapacity(area=area, visit_date=visit_date, visit_time=visit_time, booked=booked))
+    db.session.commit()
+    return len(rows)
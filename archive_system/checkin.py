@@ -0,0 +1,235 @@
+"""
+入馆核验
+已同意的预约签发带签名的入馆码（itsdangerous），入馆码只在参观当日有效。
+入馆码使用独立的 CHECKIN_SECRET_KEY 签名，不使用 Flask 的 SECRET_KEY：核验端设备只持有入馆码密钥，
+设备泄露时最多能伪造入馆码（更换该密钥即可作废），无法伪造访客或管理员的会话。
+核验端只需要入馆码密钥和一份定期同步的"已撤销预约 id 位图"即可离线判定，不再逐人查询数据库：
+    verifier = OfflineVerifier(CHECKIN_SECRET_KEY)
+    verifier.update_bitmap(RevokedBitmap.from_bytes(GET /admin/checkin/revoked 的响应体))
+    ok, message, res_id = verifier.verify(token)
+签到记录放入内存队列，由后台线程批量写入 check_in 表，核验请求不等待数据库写入。
+"""
+import hashlib
+import hmac
+import queue
+import threading
+import time
+import zlib
+from datetime import date, datetime
+from flask import current_app
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from .extensions import db
+from .models import CheckIn, Reservation
+
+TOKEN_SALT = "checkin"
+APPROVED = "已同意"
+# 处于这些状态的预约，已签发的入馆码一律作废
+REVOKED_STATUSES = ("已拒绝", "已取消")
+
+def _serializer(secret_key):
+    return URLSafeTimedSerializer(secret_key, salt=TOKEN_SALT)
+
+def checkin_secret_key():
+    """
+    入馆码密钥：优先使用 CHECKIN_SECRET_KEY；未配置时由 SECRET_KEY 单向派生，
+    派生结果可以交给核验端而不暴露 SECRET_KEY（部署离线核验端时建议显式配置）
+    """
+    key = current_app.config.get("CHECKIN_SECRET_KEY")
+    if key:
+        return key
+    return hmac.new(current_app.config["SECRET_KEY"].encode(), b"checkin-token", hashlib.sha256).hexdigest()
+
+def issue_token(reservation):
+    """为已同意的预约签发入馆码，载荷只有 [预约 id, 参观日期序数]，保持二维码足够小"""
+    return _serializer(checkin_secret_key()).dumps(
+        [reservation.id, reservation.visit_date.toordinal()]
+    )
+
+class RevokedBitmap:
+    """已撤销预约 id 位图：第 n 位为 1 表示预约 n 已撤销，十万条预约约 12KB（压缩前）"""
+
+    def __init__(self, bits=b""):
+        self.bits = bytes(bits)
+
+    @classmethod
+    def from_ids(cls, ids):
+        bits = bytearray()
+        for res_id in ids:
+            index = res_id >> 3
+            if index >= len(bits):
+                bits.extend(b"\0" * (index + 1 - len(bits)))
+            bits[index] |= 1 << (res_id & 7)
+        return cls(bits)
+
+    @classmethod
+    def from_bytes(cls, data):
+        return cls(zlib.decompress(data)) if data else cls()
+
+    def to_bytes(self):
+        return zlib.compress(self.bits)
+
+    def __contains__(self, res_id):
+        index = res_id >> 3
+        return index < len(self.bits) and bool(self.bits[index] & (1 << (res_id & 7)))
+
+def load_revoked_bitmap():
+    """从数据库生成撤销位图（只读取 id 列）"""
+    ids = db.session.execute(
+        select(Reservation.id).where(Reservation.status.in_(REVOKED_STATUSES))
+    ).scalars()
+    return RevokedBitmap.from_ids(ids)
+
+class OfflineVerifier:
+    """离线核验器：只依赖签名密钥与撤销位图，同一核验端当日重复入馆会被拦截"""
+
+    def __init__(self, secret_key, bitmap=None, max_age=None):
+        self.serializer = _serializer(secret_key)
+        self.bitmap = bitmap or RevokedBitmap()
+        self.max_age = max_age
+        self.bitmap_loaded_at = 0
+        self._lock = threading.Lock()
+        self._seen_day = None
+        self._seen = set()
+
+    def update_bitmap(self, bitmap):
+        self.bitmap = bitmap
+        self.bitmap_loaded_at = time.monotonic()
+
+    def verify(self, token, today=None):
+        """返回 (是否放行, 提示信息, 预约 id)"""
+        try:
+            payload = self.serializer.loads(token, max_age=self.max_age)
+        except SignatureExpired:
+            return False, "入馆码已过期", None
+        except BadSignature:
+            return False, "入馆码无效", None
+        if not (isinstance(payload, list) and len(payload) == 2 and all(isinstance(v, int) for v in payload)):
+            return False, "入馆码无效", None
+
+        res_id, visit_ordinal = payload
+        today = (today or date.today()).toordinal()
+        if visit_ordinal < today:
+            return False, "入馆码已过期", res_id
+        if visit_ordinal > today:
+            return False, f"未到参观日期（{date.fromordinal(visit_ordinal).isoformat()}）", res_id
+        if res_id in self.bitmap:
+            return False, "预约已撤销", res_id
+
+        with self._lock:
+            if self._seen_day != today:
+                self._seen_day = today
+                self._seen.clear()
+            if res_id in self._seen:
+                return False, "该预约今日已入馆", res_id
+            self._seen.add(res_id)
+        return True, "核验通过", res_id
+
+def get_verifier():
+    """服务端核验器：撤销位图每 CHECKIN_BITMAP_REFRESH 秒从数据库重新生成一次"""
+    verifier = current_app.extensions.get("checkin_verifier")
+    if verifier is None:
+        verifier = OfflineVerifier(
+            checkin_secret_key(), max_age=current_app.config.get("CHECKIN_TOKEN_MAX_AGE")
+        )
+        current_app.extensions["checkin_verifier"] = verifier
+    if time.monotonic() - verifier.bitmap_loaded_at > current_app.config.get("CHECKIN_BITMAP_REFRESH", 30):
+        verifier.update_bitmap(load_revoked_bitmap())
+    return verifier
+
+class CheckinRecorder:
+    """签到记录异步写入：请求线程只入队，后台线程攒批后一次事务写入"""
+
+    def __init__(self, app):
+        self.app = app
+        self.batch_size = app.config.get("CHECKIN_BATCH_SIZE", 200)
+        self._queue = queue.Queue()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def record(self, res_id, gate=None):
+        self._queue.put({"reservation_id": res_id, "gate": gate, "checked_in_at": datetime.now()})
+        self._wakeup.set()
+
+    def _drain(self):
+        batch = {}
+        while len(batch) < self.batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.setdefault(item["reservation_id"], item)
+        return list(batch.values())
+
+    def _write(self, rows):
+        existing = set(db.session.execute(
+            select(CheckIn.reservation_id).where(CheckIn.reservation_id.in_([row["reservation_id"] for row in rows]))
+        ).scalars())
+        rows = [row for row in rows if row["reservation_id"] not in existing]
+        if not rows:
+            return
+        try:
+            db.session.execute(CheckIn.__table__.insert(), rows)
+            db.session.commit()
+        except IntegrityError:
+            # 多个进程同时写入同一预约：逐条写入，跳过已存在的记录
+            db.session.rollback()
+            for row in rows:
+                try:
+                    with db.session.begin_nested():
+                        db.session.execute(CheckIn.__table__.insert(), [row])
+                except IntegrityError:
+                    pass
+            db.session.commit()
+
+    def flush(self):
+        """写入队列中的全部记录，返回写入条数（需在应用上下文中调用）"""
+        total = 0
+        while True:
+            rows = self._drain()
+            if not rows:
+                return total
+            try:
+                self._write(rows)
+            except Exception:
+                db.session.rollback()
+                for row in rows:
+                    self._queue.put(row)
+                raise
+            total += len(rows)
+
+    def run_forever(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                with self.app.app_context():
+                    self.flush()
+            except Exception:
+                self.app.logger.exception("签到记录写入失败")
+                time.sleep(1)
+                self._wakeup.set()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self.run_forever, name="checkin-recorder", daemon=True)
+                self._thread.start()
+
+def get_recorder():
+    recorder = current_app.extensions.get("checkin_recorder")
+    if recorder is None:
+        recorder = CheckinRecorder(current_app._get_current_object())
+        current_app.extensions["checkin_recorder"] = recorder
+    return recorder
+
+def record_checkin(res_id, gate=None):
+    """记录一次入馆；CHECKIN_BACKGROUND 关闭时在当前请求内直接写入"""
+    recorder = get_recorder()
+    recorder.record(res_id, gate)
+    if current_app.config.get("CHECKIN_BACKGROUND", True):
+        recorder.start()
+    else:
+        recorder.flush()
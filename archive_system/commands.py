@@ -0,0 +1,82 @@
+import click
+from .archive import archive_reservations
+from .assets import build_assets
+from .capacity import rebuild_capacity
+from .checkin import load_revoked_bitmap
+from .migrations import upgrade_all
+from .notify import get_dispatcher
+from .stats import rebuild_daily_stats
+
+def register_commands(app):
+    """注册 flask 命令行工具"""
+
+    @app.cli.command("init-db")
+    def init_db_command():
+        """建表并写入默认管理员、系统配置与公告"""
+        from . import init_db
+        init_db()
+        click.echo("数据库初始化完成")
+
+    @app.cli.command("rebuild-capacity")
+    def rebuild_capacity_command():
+        """根据预约记录重建时段名额台账"""
+        count = rebuild_capacity()
+        click.echo(f"名额台账已重建，共 {count} 个时段")
+
+    @app.cli.command("backfill-stats")
+    def backfill_stats_command():
+        """根据预约记录回填统计汇总表"""
+        count = rebuild_daily_stats()
+        click.echo(f"统计汇总已回填，共 {count} 行")
+
+    @app.cli.command("upgrade-db")
+    def upgrade_db_command():
+        """升级已有数据库的表结构并迁移历史数据"""
+        for name, result in upgrade_all():
+            click.echo(f"{name}: {result}")
+
+    @app.cli.command("dispatch-notifications")
+    @click.option("--once", is_flag=True, help="只处理当前到期的通知后退出")
+    def dispatch_notifications_command(once):
+        """以独立进程运行通知发件箱分发器"""
+        dispatcher = get_dispatcher()
+        if once:
+            total = 0
+            while True:
+                count = dispatcher.dispatch_once()
+                if not count:
+                    break
+                total += count
+            click.echo(f"已处理 {total} 条通知")
+        else:
+            dispatcher.run_forever()
+
+    @app.cli.command("export-revoked-bitmap")
+    @click.argument("path", type=click.Path(dir_okay=False))
+    def export_revoked_bitmap_command(path):
+        """导出撤销位图文件，供无法联网的核验端拷贝使用"""
+        data = load_revoked_bitmap().to_bytes()
+        with open(path, "wb") as f:
+            f.write(data)
+        click.echo(f"已导出 {len(data)} 字节")
+
+    @app.cli.command("archive-reservations")
+    @click.option("--horizon-days", type=int, help="归档参观日期早于 N 天前的预约，默认 ARCHIVE_HORIZON_DAYS")
+    @click.option("--batch-size", type=int, help="每批迁移条数，默认 ARCHIVE_BATCH_SIZE")
+    def archive_reservations_command(horizon_days, batch_size):
+        """将历史预约分批迁入归档表（可定期执行，中断后可重复执行）"""
+        count = archive_reservations(
+            horizon_days if horizon_days is not None else app.config["ARCHIVE_HORIZON_DAYS"],
+            batch_size or app.config["ARCHIVE_BATCH_SIZE"],
+        )
+        click.echo(f"已归档 {count} 条预约")
+
+    @app.cli.command("build-assets")
+    @click.option("--prune", is_flag=True, help="删除 static 下未被模板引用的文件")
+    def build_assets_command(prune):
+        """为模板引用的静态文件生成带内容哈希的副本与 gzip/brotli 预压缩文件"""
+        manifest, removed = build_assets(app, prune)
+        for name, hashed in manifest.items():
+            click.echo(f"{name} -> {hashed}")
+        if removed:
+            click.echo(f"已删除 {len(removed)} 个未引用的文件")
@@ -1,7 +1,81 @@
 import os
 
+def engine_options(database_uri):
+    """按数据库类型生成连接池配置（生产环境使用）"""
+    if database_uri.startswith("sqlite"):
+        # SQLite：连接可跨线程复用，写锁等待交给 busy_timeout
+        return {
+            "connect_args": {"check_same_thread": False, "timeout": 30},
+            "pool_size": 10,
+            "max_overflow": 20,
+            "pool_timeout": 30,
+        }
+    # MySQL / PostgreSQL：回收空闲连接，避免被服务端 wait_timeout 断开
+    return {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    }
+
 class Config:
     SECRET_KEY = os.environ.get("SECRET_KEY") or "your_secret_key_here"
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL") or "sqlite:///archive.db"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    # SQLALCHEMY_ENGINE_OPTIONS = {"connect_args": {"check_same_thread": False}} # SQLite专用，MySQL需注释
+    # 配置/公告缓存：版本文件默认位于实例目录，多进程共享；最长缓存时间兜底（秒）
+    CACHE_VERSION_FILE = os.environ.get("CACHE_VERSION_FILE")
+    CACHE_MAX_AGE = 300
+    ADMIN_CREDENTIAL_MAX_AGE = 30
+    # 通知发件箱：发送器（console / fake），是否在 Web 进程内启动后台发送线程
+    NOTIFY_SENDER = os.environ.get("NOTIFY_SENDER") or "console"
+    NOTIFY_BACKGROUND = True
+    NOTIFY_BATCH_SIZE = 50
+    NOTIFY_MAX_ATTEMPTS = 5
+    NOTIFY_RETRY_BASE = 5  # 首次重试间隔（秒），之后按 2 倍递增
+    # 时段余量日历：最多提供未来多少天，跨进程变更的最长同步间隔（秒）
+    AVAILABILITY_MAX_DAYS = 30
+    AVAILABILITY_REFRESH = 5
+    # 预约提交限流（令牌桶：容量, 每秒补充数）；配置 Redis 地址后多 worker 共享限流状态
+    RESERVE_USER_BUCKET = (5, 0.1)
+    # 按来源 IP 限流默认关闭：校园网、运营商 NAT 下大量访客共用一个出口 IP，需要时按实际出口规模配置
+    RESERVE_IP_BUCKET = None
+    RATELIMIT_STORAGE_URL = os.environ.get("RATELIMIT_STORAGE_URL")
+    # 部署在反向代理之后时信任的代理层数（按 X-Forwarded-For / X-Forwarded-Proto 还原客户端地址与协议），0 表示不信任
+    PROXY_FIX_HOPS = 0
+    # 团队成员名单导入：每块写入并提交的行数、单份名单人数上限
+    ROSTER_CHUNK_SIZE = 200
+    ROSTER_MAX_ROWS = 500
+    # 入馆码签名密钥（离线核验端设备持有），与 SECRET_KEY 分开配置；未配置时由 SECRET_KEY 单向派生
+    CHECKIN_SECRET_KEY = os.environ.get("CHECKIN_SECRET_KEY")
+    # 入馆码：签发后最长有效秒数（另有仅参观当日有效的限制）、撤销位图刷新间隔、签到记录后台写入
+    CHECKIN_TOKEN_MAX_AGE = 40 * 24 * 3600
+    CHECKIN_BITMAP_REFRESH = 30
+    CHECKIN_BACKGROUND = True
+    # 历史预约归档：参观日期早于 N 天前的预约迁入归档表（flask archive-reservations）
+    ARCHIVE_HORIZON_DAYS = 365
+    ARCHIVE_BATCH_SIZE = 1000
+    # 请求级 SQL/耗时统计（/admin/metrics），默认关闭；配置 METRICS_TOKEN 后抓取端可用 Bearer 令牌访问
+    METRICS_ENABLED = os.environ.get("METRICS_ENABLED") == "1"
+    METRICS_N_PLUS_ONE_THRESHOLD = 5
+    METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+    # 管理端实时推送（SSE）：多 worker 时按 updated_at 兜底同步的间隔（秒，0 关闭）、
+    # 单个连接的最长时长（到期后浏览器自动重连，避免长期占用 worker 线程）、可补发的最近事件数
+    LIVE_POLL_INTERVAL = 5
+    LIVE_STREAM_TIMEOUT = 300
+    LIVE_BUFFER_SIZE = 500
+    # SQLite 连接建立时执行的 PRAGMA（开发环境保持默认）
+    SQLITE_PRAGMAS = {}
+
+class ProductionConfig(Config):
+    """生产环境配置：配合 wsgi.py 以多 worker 方式部署"""
+    DEBUG = False
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(Config.SQLALCHEMY_DATABASE_URI)
+    # gunicorn 前通常有一层 nginx；直接对外提供服务时设置 PROXY_FIX_HOPS=0，避免客户端伪造来源地址
+    PROXY_FIX_HOPS = int(os.environ.get("PROXY_FIX_HOPS", 1))
+    # WAL 模式下读写互不阻塞；写锁冲突时最多等待 busy_timeout 毫秒而不是立即报错
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "busy_timeout": 30000,
+        "synchronous": "NORMAL",
+    }
@@ -0,0 +1,46 @@
+from sqlalchemy import update, func
+from sqlalchemy.exc import IntegrityError
+from .extensions import db
+from .models import StatusCounter, Reservation
+
+def bump_status(status, delta=1):
+    """在当前事务中调整某个状态的预约总数"""
+    result = db.session.execute(
+        update(StatusCounter)
+        .where(StatusCounter.status == status)
+        .values(total=StatusCounter.total + delta)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        return
+
+    # 计数行不存在时补建；并发补建冲突时回退到更新
+    try:
+        with db.session.begin_nested():
+            db.session.add(StatusCounter(status=status, total=delta))
+    except IntegrityError:
+        bump_status(status, delta)
+
+def move_status(old_status, new_status, count=1):
+    """预约状态流转时同步调整计数"""
+    if old_status == new_status or not count:
+        return
+    bump_status(old_status, -count)
+    bump_status(new_status, count)
+
+def status_totals():
+    """返回 {状态: 总数}"""
+    return {row.status: row.total for row in StatusCounter.query.all()}
+
+def rebuild_status_counters():
+    """根据预约记录重建状态计数"""
+    rows = (
+        db.session.query(Reservation.status, func.count(Reservation.id))
+        .group_by(Reservation.status)
+        .all()
+    )
+    db.session.query(StatusCounter).delete()
+    for status, total in rows:
+        db.session.add(StatusCounter(status=status, total=total))
+    db.session.commit()
+    return len(rows)
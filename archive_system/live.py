@@ -0,0 +1,120 @@
+"""
+管理端实时推送（Server-Sent Events）
+预约提交、审核、取消与候补转正在事务提交后调用 publish_changes，向本进程的 LiveHub 发布 (预约 id, 状态)；
+/admin/live 的连接被即时唤醒，按 id 读取这些预约、渲染成表格行推送给页面，页面就地替换或插入该行，
+不必整页刷新重新执行列表、计数、公告与配置查询。
+多 worker 部署时其他进程的变更不会发布到本进程：有连接时每个进程每 LIVE_POLL_INTERVAL 秒
+按 updated_at 索引查询一次最近变更的预约作为兜底，已发布过的 (id, 状态) 会被跳过。
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import select
+from .extensions import db
+from .models import Reservation
+
+# 兜底查询单次最多读取的变更条数
+POLL_LIMIT = 200
+
+class LiveHub:
+    """进程内发布/订阅：事件按序号保存在环形缓冲区，断线重连时按 Last-Event-ID 补发"""
+
+    def __init__(self, buffer_size=500, poll_interval=5):
+        self.token = uuid.uuid4().hex[:8]
+        self.poll_interval = poll_interval
+        self._cond = threading.Condition()
+        self._events = deque(maxlen=buffer_size)
+        self._seq = 0
+        self._published = OrderedDict()
+        self._poll_lock = threading.Lock()
+        self._polled_at = 0
+        self._watermark = None
+
+    @property
+    def last_seq(self):
+        return self._seq
+
+    def event_id(self, seq):
+        return f"{self.token}-{seq}"
+
+    def parse_event_id(self, value):
+        """解析 Last-Event-ID；来自其他进程、重启前或已超出缓冲区的序号返回 None"""
+        token, _, seq = (value or "").partition("-")
+        if token != self.token or not seq.isdigit():
+            return None
+        seq = int(seq)
+        with self._cond:
+            if seq > self._seq or (self._events and seq < self._events[0][0] - 1):
+                return None
+        return seq
+
+    def publish(self, items):
+        """发布 (预约 id, 状态)，同一预约重复发布相同状态会被忽略"""
+        with self._cond:
+            for res_id, status in items:
+                if self._published.get(res_id) == status:
+                    continue
+                self._published[res_id] = status
+                self._published.move_to_end(res_id)
+                if len(self._published) > self._events.maxlen:
+                    self._published.popitem(last=False)
+                self._seq += 1
+                self._events.append((self._seq, res_id, status))
+            self._cond.notify_all()
+
+    def wait(self, seq, timeout):
+        """
+        等待序号 seq 之后的事件，最多 timeout 秒
+        返回 (最新序号, {预约 id: 状态})；seq 已超出缓冲区时事件为 None，页面需整体刷新
+        """
+        with self._cond:
+            if self._seq == seq:
+                self._cond.wait(timeout)
+            if self._events and seq < self._events[0][0] - 1:
+                return self._seq, None
+            changes = {res_id: status for event_seq, res_id, status in self._events if event_seq > seq}
+            return self._seq, changes
+
+    def poll(self):
+        """多进程兜底：读取最近变更的预约并发布（需在应用上下文中调用，未到间隔时直接返回）"""
+        if not self.poll_interval or not self._poll_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() - self._polled_at < self.poll_interval:
+                return
+            self._polled_at = time.monotonic()
+            now = datetime.now()
+            since, self._watermark = self._watermark, now
+            if since is None:
+                return
+            # 多读一个间隔，覆盖写入时间早于上次查询、提交晚于上次查询的事务
+            overlap = timedelta(seconds=self.poll_interval)
+            rows = db.session.execute(
+                select(Reservation.id, Reservation.status, Reservation.updated_at)
+                .where(Reservation.updated_at >= since - overlap)
+                .order_by(Reservation.updated_at)
+                .limit(POLL_LIMIT)
+            ).all()
+            if len(rows) == POLL_LIMIT:
+                # 变更过多时下一轮从本轮读到的位置继续
+                self._watermark = rows[-1].updated_at + overlap
+                self._polled_at = 0
+        finally:
+            self._poll_lock.release()
+        self.publish((row.id, row.status) for row in rows)
+
+def init_app(app):
+    app.extensions["live_hub"] = LiveHub(
+        app.config.get("LIVE_BUFFER_SIZE", 500),
+        app.config.get("LIVE_POLL_INTERVAL", 5),
+    )
+
+def get_hub():
+    return current_app.extensions["live_hub"]
+
+def publish_changes(res_ids, status):
+    """业务事务提交后调用：通知本进程的管理端页面这些预约已变为 status"""
+    get_hub().publish((res_id, status) for res_id in res_ids)
@@ -0,0 +1,166 @@
+"""
+请求级 SQL 与耗时统计（METRICS_ENABLED 开启时生效）
+通过 SQLAlchemy 引擎事件统计每个请求的 SQL 条数与数据库耗时，通过 Flask 请求钩子与模板信号
+统计请求总耗时与模板渲染耗时，并按端点累计；同一请求内同一条 SQL 重复执行达到阈值时记为疑似 N+1。
+数据保存在各进程内存中，由 /admin/metrics 以 Prometheus 文本格式输出（多 worker 时需分别抓取）。
+未开启时不注册任何钩子，对请求没有额外开销。
+"""
+import threading
+import time
+from collections import Counter, defaultdict
+from flask import before_render_template, current_app, g, has_app_context, request, template_rendered
+from sqlalchemy import event
+from .extensions import db
+
+PREFIX = "archive"
+# N+1 疑似语句标签中保留的 SQL 长度
+STATEMENT_LABEL_LENGTH = 120
+
+class RequestMetrics:
+    """单个请求的统计"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.render_seconds = 0.0
+        self.render_started = None
+        self.statements = Counter()
+
+class EndpointMetrics:
+    """单个端点的累计统计"""
+
+    def __init__(self):
+        self.requests = 0
+        self.request_seconds = 0.0
+        self.queries = 0
+        self.max_queries = 0
+        self.db_seconds = 0.0
+        self.render_seconds = 0.0
+        self.n_plus_one = 0
+        self.repeated = {}
+
+class MetricsRegistry:
+
+    def __init__(self, n_plus_one_threshold):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._lock = threading.Lock()
+        self._endpoints = defaultdict(EndpointMetrics)
+
+    def observe(self, endpoint, stats):
+        elapsed = time.perf_counter() - stats.started
+        repeated = {
+            statement: count
+            for statement, count in stats.statements.items()
+            if count >= self.n_plus_one_threshold
+        }
+        with self._lock:
+            metrics = self._endpoints[endpoint]
+            metrics.requests += 1
+            metrics.request_seconds += elapsed
+            metrics.queries += stats.queries
+            metrics.max_queries = max(metrics.max_queries, stats.queries)
+            metrics.db_seconds += stats.db_seconds
+            metrics.render_seconds += stats.render_seconds
+            if repeated:
+                metrics.n_plus_one += 1
+                for statement, count in repeated.items():
+                    metrics.repeated[statement] = max(metrics.repeated.get(statement, 0), count)
+
+    def render(self):
+        """输出 Prometheus 文本格式"""
+        with self._lock:
+            items = sorted(self._endpoints.items())
+            series = [
+                ("http_requests_total", "counter", "请求数", lambda m: m.requests),
+                ("http_request_seconds_total", "counter", "请求总耗时（秒）", lambda m: m.request_seconds),
+                ("db_queries_total", "counter", "SQL 语句数", lambda m: m.queries),
+                ("db_queries_per_request_max", "gauge", "单个请求的最大 SQL 语句数", lambda m: m.max_queries),
+                ("db_seconds_total", "counter", "SQL 执行总耗时（秒）", lambda m: m.db_seconds),
+                ("template_render_seconds_total", "counter", "模板渲染总耗时（秒）", lambda m: m.render_seconds),
+                ("n_plus_one_requests_total", "counter", "出现疑似 N+1 查询的请求数", lambda m: m.n_plus_one),
+            ]
+            lines = []
+            for name, kind, help_text, getter in series:
+                lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+                lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+                for endpoint, metrics in items:
+                    lines.append(f'{PREFIX}_{name}{{endpoint="{_escape(endpoint)}"}} {_number(getter(metrics))}')
+
+            name = f"{PREFIX}_n_plus_one_statement_repeats"
+            lines.append(f"# HELP {name} 疑似 N+1 语句在单个请求内的最大重复次数")
+            lines.append(f"# TYPE {name} gauge")
+            for endpoint, metrics in items:
+                for statement, count in sorted(metrics.repeated.items(), key=lambda item: -item[1]):
+                    label = " ".join(statement.split())[:STATEMENT_LABEL_LENGTH]
+                    lines.append(f'{name}{{endpoint="{_escape(endpoint)}",statement="{_escape(label)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+def _number(value):
+    return f"{value:.6f}" if isinstance(value, float) else str(value)
+
+def _current():
+    return g.get("_request_metrics") if has_app_context() else None
+
+def init_app(app):
+    """按 METRICS_ENABLED 配置注册引擎事件、请求钩子与模板信号"""
+    if not app.config.get("METRICS_ENABLED"):
+        return
+    registry = MetricsRegistry(app.config.get("METRICS_N_PLUS_ONE_THRESHOLD", 5))
+    app.extensions["metrics_registry"] = registry
+
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _current()
+        if stats is not None:
+            conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _current()
+        started = conn.info.get("metrics_started")
+        if stats is None or not started:
+            return
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started.pop()
+        stats.statements[statement] += 1
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        started = exception_context.connection.info.get("metrics_started") if exception_context.connection else None
+        if started:
+            started.pop()
+
+    @app.before_request
+    def start_request_metrics():
+        g._request_metrics = RequestMetrics()
+
+    @app.teardown_request
+    def finish_request_metrics(exc):
+        stats = g.pop("_request_metrics", None)
+        if stats is not None:
+            registry.observe(request.endpoint or "unknown", stats)
+
+    def render_started(sender, template, context, **extra):
+        stats = _current()
+        if stats is not None:
+            stats.render_started = time.perf_counter()
+
+    def render_finished(sender, template, context, **extra):
+        stats = _current()
+        if stats is not None and stats.render_started is not None:
+            stats.render_seconds += time.perf_counter() - stats.render_started
+            stats.render_started = None
+
+    before_render_template.connect(render_started, app, weak=False)
+    template_rendered.connect(render_finished, app, weak=False)
+
+def get_registry():
+    """未开启统计时返回 None"""
+    return current_app.extensions.get("metrics_registry")
@@ -0,0 +1,263 @@
+"""
+数据库结构升级脚本
+项目未引入 Flask-Migrate，已有数据库通过 `flask upgrade-db` 按顺序执行以下升级步骤。
+每个步骤都可重复执行：已升级过的库会被自动跳过，中途中断后重新执行会从断点继续。
+"""
+from datetime import datetime
+from sqlalchemy import inspect, insert, select, update, text, MetaData, Table
+from .extensions import db
+from .models import ArchivedReservation, Reservation, SlotCapacity, StatusCounter, User, UserSearchGram, ReservationDailyStat
+from .capacity import rebuild_capacity
+from .counters import rebuild_status_counters
+from .search import has_stale_grams, rebuild_user_index
+from .stats import rebuild_daily_stats
+
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y%m%d")
+
+def _parse_date(value):
+    """将旧数据中的日期字符串转换为 date，无法识别的返回 None"""
+    if not value:
+        return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), fmt).date()
+        except ValueError:
+            continue
+    return None
+
+def _swap_reservation_table():
+    """删除旧 reservation 表并把 reservation_new 改名为 reservation"""
+    with db.engine.connect() as conn:
+        sqlite = conn.dialect.name == "sqlite"
+        if sqlite:
+            # 暂时关闭外键检查：删除旧表时不对引用它的表做级联检查
+            foreign_keys = conn.exec_driver_sql("PRAGMA foreign_keys").scalar()
+            conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        conn.execute(text("DROP TABLE IF EXISTS reservation"))
+        conn.execute(text("ALTER TABLE reservation_new RENAME TO reservation"))
+        conn.commit()
+        if sqlite:
+            conn.exec_driver_sql(f"PRAGMA foreign_keys={int(foreign_keys)}")
+
+def _create_reservation_new():
+    """
+    按当前模型建 reservation_new 表（已存在时直接返回）
+    新表放在独立的 MetaData 中（连同外键引用的 user 表），不影响 db.create_all；
+    索引不随新表创建（SQLite 中索引名全局唯一，会与旧表同名索引冲突），换表后再补建
+    """
+    metadata = MetaData()
+    User.__table__.to_metadata(metadata)
+    new_table = Reservation.__table__.to_metadata(metadata, name="reservation_new")
+    new_table.indexes.clear()
+    new_table.create(db.engine, checkfirst=True)
+    return new_table
+
+def _copy_reservations(new_table, batch_size, convert=None):
+    """分批把 reservation 拷贝到 reservation_new，从新表中已有的最大 id 之后继续，支持中断后重跑"""
+    old_table = Table("reservation", MetaData(), autoload_with=db.engine)
+    # 生成列（audit_priority）由数据库计算，不能写入
+    copy_columns = [c for c in old_table.c if c.name in new_table.c and new_table.c[c.name].computed is None]
+
+    last_id = db.session.query(db.func.max(new_table.c.id)).scalar() or 0
+    copied = 0
+    while True:
+        rows = db.session.execute(
+            select(*copy_columns)
+            .where(old_table.c.id > last_id)
+            .order_by(old_table.c.id)
+            .limit(batch_size)
+        ).mappings().all()
+        if not rows:
+            break
+
+        batch = [dict(row) for row in rows]
+        if convert is not None:
+            for item in batch:
+                convert(item)
+        db.session.execute(insert(new_table), batch)
+        db.session.commit()
+
+        last_id = rows[-1]["id"]
+        copied += len(rows)
+    return copied
+
+def _rebuild_reservation_indexes():
+    for index in Reservation.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+
+def _convert_legacy_reservation(item):
+    item["visit_date"] = _parse_date(item.get("visit_date"))
+    item["updated_at"] = item.get("created_at")
+
+def upgrade_reservation_visit_date(batch_size=1000):
+    """
+    reservation.visit_date 由字符串改为 Date 类型，并补建索引
+    SQLite 不支持修改列类型，采用“建新表 reservation_new -> 分批拷贝 -> 删除旧表 -> 新表改名”的方式。
+    不改名旧表：SQLite 3.26 起改名会把其他表指向 reservation 的外键一并改写，旧表删除后外键将失效。
+    返回: 本次拷贝的记录数
+    """
+    tables = inspect(db.engine).get_table_names()
+    if "reservation" not in tables:
+        if "reservation_new" in tables:
+            _swap_reservation_table()  # 上次在删除旧表后中断
+            _rebuild_reservation_indexes()
+        return 0
+    columns = [c["name"] for c in inspect(db.engine).get_columns("reservation")]
+    if "audit_priority" in columns:
+        return 0  # 已是新结构
+
+    new_table = _create_reservation_new()
+    copied = _copy_reservations(new_table, batch_size, _convert_legacy_reservation)
+    _swap_reservation_table()
+    _rebuild_reservation_indexes()
+
+    # 名额台账按新的日期类型重建
+    SlotCapacity.__table__.drop(db.engine, checkfirst=True)
+    SlotCapacity.__table__.create(db.engine)
+    rebuild_capacity()
+    return copied
+
+def _bump_reservation_sequence():
+    """AUTOINCREMENT 计数器不低于热表与归档表中的最大 id，已归档的 id 不会再分配给新预约"""
+    max_id = max(
+        db.session.query(db.func.max(Reservation.id)).scalar() or 0,
+        db.session.query(db.func.max(ArchivedReservation.id)).scalar() or 0,
+    )
+    with db.engine.begin() as conn:
+        updated = conn.execute(
+            text("UPDATE sqlite_sequence SET seq = :max_id WHERE name = 'reservation' AND seq < :max_id"),
+            {"max_id": max_id},
+        ).rowcount
+        exists = conn.execute(text("SELECT 1 FROM sqlite_sequence WHERE name = 'reservation'")).first()
+        if not updated and not exists and max_id:
+            conn.execute(text("INSERT INTO sqlite_sequence (name, seq) VALUES ('reservation', :max_id)"), {"max_id": max_id})
+
+def upgrade_reservation_autoincrement(batch_size=1000):
+    """
+    SQLite 下 reservation 主键改为 AUTOINCREMENT：归档会删除热表中 id 最大的预约，
+    普通 INTEGER PRIMARY KEY 会把这些 id 重新分配给新预约，与归档表（保留原 id）、入馆码及撤销位图冲突。
+    同样采用建新表拷贝再换表的方式，返回本次拷贝的记录数（其他数据库的自增序列本就不会回退）
+    """
+    if db.engine.dialect.name != "sqlite":
+        return 0
+    tables = inspect(db.engine).get_table_names()
+    copied = 0
+    if "reservation" not in tables:
+        if "reservation_new" in tables:
+            _swap_reservation_table()  # 上次在删除旧表后中断
+            _rebuild_reservation_indexes()
+    else:
+        sql = db.session.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'reservation'")
+        ).scalar()
+        if "AUTOINCREMENT" not in sql.upper():
+            new_table = _create_reservation_new()
+            copied = _copy_reservations(new_table, batch_size)
+            _swap_reservation_table()
+            _rebuild_reservation_indexes()
+    _bump_reservation_sequence()
+    return copied
+
+def upgrade_status_counters():
+    """首次引入状态计数表时，根据已有预约初始化计数"""
+    if StatusCounter.query.first() or not Reservation.query.first():
+        return 0
+    return rebuild_status_counters()
+
+def upgrade_user_search_index():
+    """首次引入用户检索索引时为已有用户建立索引；索引中仍有未转小写的姓名 gram 时整体重建"""
+    if not User.query.first():
+        return 0
+    if UserSearchGram.query.first() and not has_stale_grams():
+        return 0
+    return rebuild_user_index()
+
+def upgrade_daily_stats():
+    """首次引入统计汇总表时回填历史数据"""
+    if ReservationDailyStat.query.first() or not Reservation.query.first():
+        return 0
+    return rebuild_daily_stats()
+
+def upgrade_reservation_dedupe_keys(batch_size=1000):
+    """
+    新增幂等键 idempotency_key 与有效预约键 active_key 两列及其唯一索引
+    已有数据中同一用户同一时段存在多条有效预约时，只为最早的一条生成 active_key
+    返回: 本次回填的记录数
+    """
+    columns = [c["name"] for c in inspect(db.engine).get_columns("reservation")]
+    with db.engine.begin() as conn:
+        if "idempotency_key" not in columns:
+            conn.execute(text("ALTER TABLE reservation ADD COLUMN idempotency_key VARCHAR(64)"))
+        if "active_key" not in columns:
+            conn.execute(text("ALTER TABLE reservation ADD COLUMN active_key VARCHAR(100)"))
+
+    earlier = Reservation.__table__.alias("earlier")
+    first_active_id = (
+        select(db.func.min(earlier.c.id))
+        .where(
+            earlier.c.user_id == Reservation.user_id,
+            earlier.c.visit_date == Reservation.visit_date,
+            earlier.c.visit_time == Reservation.visit_time,
+            earlier.c.status != "已拒绝",
+        )
+        .scalar_subquery()
+    )
+    max_id = db.session.query(db.func.max(Reservation.id)).scalar() or 0
+    filled = 0
+    for start in range(0, max_id, batch_size):
+        result = db.session.execute(
+            update(Reservation)
+            .where(
+                Reservation.id > start,
+                Reservation.id <= start + batch_size,
+                Reservation.active_key.is_(None),
+                Reservation.status != "已拒绝",
+                Reservation.visit_date.isnot(None),
+                Reservation.id == first_active_id,
+            )
+            .values(
+                active_key=db.func.cast(Reservation.user_id, db.String)
+                + "|" + db.func.cast(Reservation.visit_date, db.String)
+                + "|" + Reservation.visit_time,
+                # 回填不算业务变更：保留原值，避免 onupdate 把全表的 updated_at 改成迁移时间
+                updated_at=Reservation.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        filled += result.rowcount
+
+    existing = {index["name"] for index in inspect(db.engine).get_indexes("reservation")}
+    for index in Reservation.__table__.indexes:
+        if index.name in ("uq_reservation_idempotency_key", "uq_reservation_active_key") and index.name not in existing:
+            index.create(db.engine)
+    return filled
+
+def upgrade_reservation_updated_at():
+    """新增最近变更时间列 updated_at（已有数据以提交时间回填）及其索引，返回回填的记录数"""
+    columns = [c["name"] for c in inspect(db.engine).get_columns("reservation")]
+    if "updated_at" in columns:
+        return 0
+    with db.engine.begin() as conn:
+        conn.execute(text("ALTER TABLE reservation ADD COLUMN updated_at DATETIME"))
+        filled = conn.execute(text("UPDATE reservation SET updated_at = created_at")).rowcount
+    next(index for index in Reservation.__table__.indexes if index.name == "ix_reservation_updated_at").create(db.engine)
+    return filled
+
+# 按顺序执行的升级步骤
+UPGRADE_STEPS = [
+    upgrade_reservation_visit_date,
+    # 其余步骤会通过 ORM 读写 reservation，需先补齐新列
+    upgrade_reservation_updated_at,
+    upgrade_status_counters,
+    upgrade_user_search_index,
+    upgrade_daily_stats,
+    upgrade_reservation_dedupe_keys,
+    # 拷贝全部列，放在补齐新列的步骤之后
+    upgrade_reservation_autoincrement,
+]
+
+def upgrade_all():
+    """依次执行全部升级步骤，返回 [(步骤名, 结果)]"""
+    db.create_all()
+    return [(step.__name__, step()) for step in UPGRADE_STEPS]
@@ -34,16 +34,180 @@ class Announcement(db.Model):
 
 class Reservation(db.Model):
     """预约记录表"""
+    __table_args__ = (
+        # 管理端列表：待审核优先，再按提交时间倒序
+        db.Index("ix_reservation_dashboard", "audit_priority", "created_at", "id"),
+        # 管理端按状态筛选
+        db.Index("ix_reservation_status_created", "status", "created_at", "id"),
+        # H5 我的预约
+        db.Index("ix_reservation_user_created", "user_id", "created_at"),
+        # 名额台账重建 / 按日期范围查询
+        db.Index("ix_reservation_slot", "area", "visit_date", "visit_time"),
+        db.Index("ix_reservation_visit_date", "visit_date"),
+        # 管理端实时推送：多进程部署时按最近变更时间兜底同步
+        db.Index("ix_reservation_updated_at", "updated_at"),
+        # 防重复提交：同一表单只落库一次；同一用户同一时段只能有一条有效预约
+        db.Index("uq_reservation_idempotency_key", "idempotency_key", unique=True),
+        db.Index("uq_reservation_active_key", "active_key", unique=True),
+        # 归档后热表中最大的 id 会被删除，SQLite 须用 AUTOINCREMENT 才不会把这些 id 再分配给新预约
+        {"sqlite_autoincrement": True},
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
     area = db.Column(db.String(50))
-    visit_date = db.Column(db.String(20))  # 建议后续改为 Date 类型
+    visit_date = db.Column(db.Date)
     visit_time = db.Column(db.String(50))
     reason = db.Column(db.String(200))
     res_type = db.Column(db.String(10))  # 个人/团队
     identity = db.Column(db.String(50))
-    status = db.Column(db.String(20), default="待审核")  # 待审核, 已同意, 已拒绝
+    status = db.Column(db.String(20), default="待审核")  # 待审核, 已同意, 已拒绝, 已取消
     reject_reason = db.Column(db.String(200))
     created_at = db.Column(db.DateTime, default=datetime.now)
+    idempotency_key = db.Column(db.String(64))  # 表单提交幂等键
+    active_key = db.Column(db.String(100))  # "用户|日期|时段"，预约被拒绝后清空
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)  # 提交或状态变化时间
+    # 审核优先级（待审核为 1，其余为 0），由数据库根据 status 自动生成，便于走索引排序
+    audit_priority = db.Column(
+        db.Integer,
+        db.Computed("CASE WHEN status = '待审核' THEN 1 ELSE 0 END", persisted=True),
+    )
 
     user = db.relationship("User", backref=db.backref("reservations", lazy=True))
+
+    is_archived = False
+
+    @staticmethod
+    def make_active_key(user_id, visit_date, visit_time):
+        return f"{user_id}|{visit_date.isoformat()}|{visit_time}"
+
+class SlotCapacity(db.Model):
+    """时段名额台账（按 校区+日期+时段 记录已占用名额）"""
+    __table_args__ = (
+        db.UniqueConstraint("area", "visit_date", "visit_time", name="uq_slot_capacity_slot"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    area = db.Column(db.String(50), nullable=False)
+    visit_date = db.Column(db.Date, nullable=False)
+    visit_time = db.Column(db.String(50), nullable=False)
+    booked = db.Column(db.Integer, default=0, nullable=False)  # 已占用名额（待审核 + 已同意）
+
+class StatusCounter(db.Model):
+    """预约状态计数表（随预约提交与审核增量维护，避免管理端每次翻页执行 COUNT(*)）"""
+    status = db.Column(db.String(20), primary_key=True)
+    total = db.Column(db.Integer, default=0, nullable=False)
+
+class UserSearchGram(db.Model):
+    """用户检索 n-gram 索引表（姓名 1/2-gram、手机号 3-gram），供管理端关键字搜索使用"""
+    gram = db.Column(db.String(20), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True, index=True)
+
+class NotificationOutbox(db.Model):
+    """通知发件箱（与业务数据同一事务写入，由后台线程异步发送）"""
+    __table_args__ = (
+        db.Index("ix_notification_outbox_due", "status", "next_attempt_at"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    event = db.Column(db.String(20), nullable=False)  # submitted, approved, rejected
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"))
+    reservation_id = db.Column(db.Integer, db.ForeignKey("reservation.id"))
+    message = db.Column(db.Text, nullable=False)
+    status = db.Column(db.String(10), default="pending", nullable=False)  # pending, sending, sent, failed
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+    claim_token = db.Column(db.String(32))
+    last_error = db.Column(db.String(500))
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    sent_at = db.Column(db.DateTime)
+
+    reservation = db.relationship("Reservation")
+
+class ReservationDailyStat(db.Model):
+    """预约统计汇总表（按 参观日期+校区+时段+预约类型+身份+状态 增量维护）"""
+    __table_args__ = (
+        db.UniqueConstraint(
+            "visit_date", "area", "visit_time", "res_type", "identity", "status",
+            name="uq_reservation_daily_stat_dims",
+        ),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    visit_date = db.Column(db.Date, nullable=False)
+    area = db.Column(db.String(50), default="", nullable=False)
+    visit_time = db.Column(db.String(50), default="", nullable=False)
+    res_type = db.Column(db.String(10), default="", nullable=False)
+    identity = db.Column(db.String(50), default="", nullable=False)
+    status = db.Column(db.String(20), nullable=False)
+    count = db.Column(db.Integer, default=0, nullable=False)
+
+class ReservationMember(db.Model):
+    """团队预约成员名单（由领队上传 CSV 名单导入）"""
+    reservation_id = db.Column(db.Integer, db.ForeignKey("reservation.id"), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+
+    user = db.relationship("User")
+
+class CheckIn(db.Model):
+    """入馆签到记录（由核验接口异步批量写入，每个预约最多一条）"""
+    id = db.Column(db.Integer, primary_key=True)
+    reservation_id = db.Column(db.Integer, db.ForeignKey("reservation.id"), unique=True, nullable=False)
+    gate = db.Column(db.String(50))
+    checked_in_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+
+class ArchivedReservation(db.Model):
+    """历史预约归档表（参观日期早于归档期限的预约由 flask archive-reservations 分批迁入，保留原 id）"""
+    __table_args__ = (
+        db.Index("ix_archived_reservation_user_created", "user_id", "created_at"),
+        db.Index("ix_archived_reservation_visit_date", "visit_date"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    area = db.Column(db.String(50))
+    visit_date = db.Column(db.Date)
+    visit_time = db.Column(db.String(50))
+    reason = db.Column(db.String(200))
+    res_type = db.Column(db.String(10))
+    identity = db.Column(db.String(50))
+    status = db.Column(db.String(20))
+    reject_reason = db.Column(db.String(200))
+    created_at = db.Column(db.DateTime)
+    checked_in_at = db.Column(db.DateTime)  # 原 check_in 记录
+    archived_at = db.Column(db.DateTime, default=datetime.now)
+
+    user = db.relationship("User")
+
+    is_archived = True
+
+class ArchivedReservationMember(db.Model):
+    """已归档团队预约的成员名单"""
+    reservation_id = db.Column(db.Integer, db.ForeignKey("archived_reservation.id"), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True, index=True)
+    created_at = db.Column(db.DateTime)
+
+class WaitlistEntry(db.Model):
+    """时段候补队列（名额已满时排队，名额释放后按 id 顺序自动转为预约）"""
+    __table_args__ = (
+        # 取某时段队首：按 (时段, 状态, id) 索引定位，无需排序扫描
+        db.Index("ix_waitlist_queue", "area", "visit_date", "visit_time", "status", "id"),
+        db.Index("ix_waitlist_user_created", "user_id", "created_at"),
+        # 同一用户同一时段只能排队一次
+        db.Index("uq_waitlist_active_key", "active_key", unique=True),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    area = db.Column(db.String(50), nullable=False)
+    visit_date = db.Column(db.Date, nullable=False)
+    visit_time = db.Column(db.String(50), nullable=False)
+    reason = db.Column(db.String(200))
+    res_type = db.Column(db.String(10))
+    identity = db.Column(db.String(50))
+    status = db.Column(db.String(20), default="waiting", nullable=False)  # waiting / promoted / cancelled
+    active_key = db.Column(db.String(100))  # 排队中为 "用户|日期|时段"，出队后清空
+    reservation_id = db.Column(db.Integer, db.ForeignKey("reservation.id"))
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    promoted_at = db.Column(db.DateTime)
@@ -0,0 +1,190 @@
+"""
+通知发件箱与后台发送
+业务代码只调用 enqueue() 把通知写入 notification_outbox（与预约变更同一事务提交），
+提交后调用 wake_dispatcher() 唤醒后台线程，由后台线程分批认领、发送、失败退避重试，
+请求线程不再等待任何网络调用。
+"""
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import update
+from .extensions import db
+from .models import NotificationOutbox
+
+class ConsoleSender:
+    """控制台发送器（微信推送接入前的模拟实现）"""
+
+    def send(self, notification):
+        print(f"【模拟微信通知】{notification['message']}")
+
+class FakeSender:
+    """本地假发送器：记录所有发送内容，可按次数模拟失败，供测试使用"""
+
+    def __init__(self, fail_times=0):
+        self.sent = []
+        self.fail_times = fail_times
+
+    def send(self, notification):
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise RuntimeError("模拟发送失败")
+        self.sent.append(notification)
+
+SENDERS = {
+    "console": ConsoleSender,
+    "fake": FakeSender,
+}
+
+def enqueue(event, user_id, message, reservation=None, reservation_id=None):
+    """
+    在当前事务中写入一条待发送通知（不提交）
+    新建的预约尚未 flush 时传 reservation，已落库的预约传 reservation_id；
+    不能同时传入 reservation=None，否则 flush 时空关系会覆盖掉 reservation_id
+    """
+    notification = NotificationOutbox(event=event, user_id=user_id, message=message)
+    if reservation is not None:
+        notification.reservation = reservation
+    else:
+        notification.reservation_id = reservation_id
+    db.session.add(notification)
+
+class OutboxDispatcher:
+    """发件箱分发器：分批认领到期通知，线程池并发发送，失败按指数退避重试"""
+
+    def __init__(self, app, sender):
+        self.app = app
+        self.sender = sender
+        self.batch_size = app.config.get("NOTIFY_BATCH_SIZE", 50)
+        self.max_attempts = app.config.get("NOTIFY_MAX_ATTEMPTS", 5)
+        self.retry_base = app.config.get("NOTIFY_RETRY_BASE", 5)
+        self.retry_max = app.config.get("NOTIFY_RETRY_MAX", 600)
+        self.lease = app.config.get("NOTIFY_LEASE", 60)
+        self.poll_interval = app.config.get("NOTIFY_POLL_INTERVAL", 2)
+        self.pool = ThreadPoolExecutor(
+            max_workers=app.config.get("NOTIFY_WORKERS", 4), thread_name_prefix="notify-send"
+        )
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _claim(self):
+        """认领一批到期通知；发送中超时（进程崩溃）的通知也会被重新认领"""
+        now = datetime.now()
+        due = (
+            NotificationOutbox.status.in_(("pending", "sending")),
+            NotificationOutbox.next_attempt_at <= now,
+        )
+        ids = [
+            row.id
+            for row in db.session.query(NotificationOutbox.id)
+            .filter(*due)
+            .order_by(NotificationOutbox.id)
+            .limit(self.batch_size)
+        ]
+        if not ids:
+            db.session.rollback()
+            return []
+
+        token = uuid.uuid4().hex
+        db.session.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id.in_(ids), *due)
+            .values(
+                status="sending",
+                claim_token=token,
+                next_attempt_at=now + timedelta(seconds=self.lease),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return NotificationOutbox.query.filter_by(claim_token=token).all()
+
+    def _send(self, notification):
+        try:
+            self.sender.send(notification)
+            return None
+        except Exception as exc:  # 任意发送异常都按失败重试处理
+            return str(exc)[:500] or exc.__class__.__name__
+
+    def dispatch_once(self):
+        """处理一批通知，返回本批数量（需在应用上下文中调用）"""
+        items = self._claim()
+        if not items:
+            return 0
+
+        payloads = [
+            {
+                "id": item.id,
+                "event": item.event,
+                "user_id": item.user_id,
+                "reservation_id": item.reservation_id,
+                "message": item.message,
+            }
+            for item in items
+        ]
+        errors = list(self.pool.map(self._send, payloads))
+
+        now = datetime.now()
+        for item, error in zip(items, errors):
+            item.attempts += 1
+            item.claim_token = None
+            if error is None:
+                item.status = "sent"
+                item.sent_at = now
+                item.last_error = None
+            elif item.attempts >= self.max_attempts:
+                item.status = "failed"
+                item.last_error = error
+            else:
+                delay = min(self.retry_base * 2 ** (item.attempts - 1), self.retry_max)
+                item.status = "pending"
+                item.next_attempt_at = now + timedelta(seconds=delay)
+                item.last_error = error
+        db.session.commit()
+        return len(items)
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            try:
+                with self.app.app_context():
+                    while self.dispatch_once() and not self._stop.is_set():
+                        pass
+            except Exception:
+                self.app.logger.exception("通知发件箱处理失败")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self.run_forever, name="notify-dispatcher", daemon=True)
+                self._thread.start()
+
+    def wake(self):
+        self._wakeup.set()
+
+    def stop(self):
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+
+def init_app(app, sender=None):
+    """为应用创建发件箱分发器；sender 为空时按 NOTIFY_SENDER 配置选择"""
+    if sender is None:
+        sender = SENDERS[app.config.get("NOTIFY_SENDER", "console")]()
+    app.extensions["notify_dispatcher"] = OutboxDispatcher(app, sender)
+
+def get_dispatcher():
+    return current_app.extensions["notify_dispatcher"]
+
+def wake_dispatcher():
+    """业务事务提交后调用：按需启动后台线程（NOTIFY_BACKGROUND 关闭时不启动）并唤醒"""
+    dispatcher = get_dispatcher()
+    if current_app.config.get("NOTIFY_BACKGROUND", True):
+        dispatcher.start()
+        dispatcher.wake()
@@ -0,0 +1,88 @@
+import base64
+import json
+import math
+from datetime import datetime
+from sqlalchemy import tuple_
+
+class KeysetPage:
+    """游标分页结果（字段与模板中原 pagination 对象的用法保持一致）"""
+
+    def __init__(self, items, page, total, per_page, has_prev, has_next, prev_cursor, next_cursor):
+        self.items = items
+        self.page = page
+        self.total = total
+        self.per_page = per_page
+        self.has_prev = has_prev
+        self.has_next = has_next
+        self.prev_cursor = prev_cursor
+        self.next_cursor = next_cursor
+
+    @property
+    def pages(self):
+        if self.total is None:
+            return None
+        return max(1, math.ceil(self.total / self.per_page))
+
+def encode_cursor(values):
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor, columns):
+    """解析游标，格式不正确时返回 None（回到第一页）"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if len(values) != len(columns):
+            return None
+        return [
+            datetime.fromisoformat(v) if col.type.python_type is datetime else col.type.python_type(v)
+            for col, v in zip(columns, values)
+        ]
+    except (ValueError, TypeError):
+        return None
+
+def keyset_paginate(query, columns, after=None, before=None, page=1, per_page=10, total=None):
+    """
+    按 columns 倒序做游标（keyset）分页
+    每页只取 per_page + 1 行并利用 (col1, col2, ...) 行值比较定位，
+    翻到再深的页也不需要 OFFSET 扫描，耗时与页码无关
+    - after:  下一页游标（取排在该游标之后的记录）
+    - before: 上一页游标（取排在该游标之前的记录）
+    """
+    key = tuple_(*columns)
+    after_values = decode_cursor(after, columns)
+    before_values = decode_cursor(before, columns)
+
+    if before_values is not None:
+        rows = (
+            query.filter(key > tuple_(*before_values))
+            .order_by(*[c.asc() for c in columns])
+            .limit(per_page + 1)
+            .all()
+        )
+        has_prev = len(rows) > per_page
+        items = list(reversed(rows[:per_page]))
+        has_next = True
+    else:
+        if after_values is not None:
+            query = query.filter(key < tuple_(*after_values))
+        rows = query.order_by(*[c.desc() for c in columns]).limit(per_page + 1).all()
+        has_next = len(rows) > per_page
+        items = rows[:per_page]
+        has_prev = after_values is not None
+
+    def cursor_of(item):
+        return encode_cursor([getattr(item, c.key) for c in columns])
+
+    return KeysetPage(
+        items=items,
+        page=max(page, 1),
+        total=total,
+        per_page=per_page,
+        has_prev=has_prev and bool(items),
+        has_next=has_next and bool(items),
+        prev_cursor=cursor_of(items[0]) if items else None,
+        next_cursor=cursor_of(items[-1]) if items else None,
+    )
@@ -0,0 +1,82 @@
+"""
+令牌桶限流
+默认使用进程内存储；配置 RATELIMIT_STORAGE_URL=redis://... 时改用 Redis 在多个 worker / 多台机器间共享令牌桶
+（需要额外安装 redis 包）。
+"""
+import threading
+import time
+from flask import current_app
+
+class MemoryStore:
+    """进程内令牌桶存储"""
+
+    def __init__(self, max_keys=100000):
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.max_keys = max_keys
+
+    def take(self, key, capacity, rate, now):
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._evict(capacity, rate, now)
+            return allowed
+
+    def _evict(self, capacity, rate, now):
+        """清理已回满的令牌桶，防止内存无限增长"""
+        full_after = capacity / rate if rate else 0
+        for key in [k for k, (_, updated) in self._buckets.items() if now - updated >= full_after]:
+            del self._buckets[key]
+
+class RedisStore:
+    """Redis 令牌桶存储（Lua 脚本保证原子性）"""
+
+    SCRIPT = """
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local tokens = tonumber(bucket[1]) or capacity
+    local updated = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + (now - updated) * rate)
+    local allowed = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+        allowed = 1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+    return allowed
+    """
+
+    def __init__(self, url):
+        import redis  # 可选依赖，仅在配置了共享存储时需要
+
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    def take(self, key, capacity, rate, now):
+        return bool(self._script(keys=[f"ratelimit:{key}"], args=[capacity, rate, now]))
+
+def _store():
+    store = current_app.extensions.get("ratelimit_store")
+    if store is None:
+        url = current_app.config.get("RATELIMIT_STORAGE_URL")
+        store = RedisStore(url) if url else MemoryStore()
+        current_app.extensions["ratelimit_store"] = store
+    return store
+
+def allow(key, bucket):
+    """
+    按令牌桶判断是否放行
+    bucket: (容量, 每秒补充令牌数)，例如 (5, 0.1) 表示最多连续 5 次，之后每 10 秒恢复 1 次；None 表示不限流
+    """
+    if bucket is None:
+        return True
+    capacity, rate = bucket
+    return _store().take(key, capacity, rate, time.time())
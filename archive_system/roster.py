@@ -0,0 +1,100 @@
+"""
+团队预约成员名单导入
+上传的 CSV 逐行流式读取，按块校验并写入：每块一次批量 upsert 用户、一次批量关联成员、一次提交，
+不会把整份名单读入内存，也不会为每个成员单独提交事务。
+"""
+import csv
+import io
+from sqlalchemy import select
+from .extensions import db
+from .models import ReservationMember
+from .users import insert_missing_users
+from .validators import validate_certificates_batch, validate_phone
+
+# CSV 表头 -> 字段；证件类型可省略，默认为身份证
+ROSTER_COLUMNS = {"姓名": "name", "证件类型": "id_type", "证件号码": "id_card", "手机号": "phone"}
+REQUIRED_COLUMNS = ("姓名", "证件号码", "手机号")
+DEFAULT_ID_TYPE = "身份证"
+# 返回给页面的错误行数上限
+MAX_REPORTED_ERRORS = 50
+
+def _validate_chunk(chunk, errors):
+    """校验一块原始行，返回按证件号去重后的有效用户数据"""
+    cert_results = validate_certificates_batch((row["id_type"], row["id_card"]) for row in chunk)
+    valid = {}
+    for row, (is_valid, msg) in zip(chunk, cert_results):
+        line = row.pop("line")
+        row["id_card"] = row["id_card"].upper().strip()
+        if not row["name"]:
+            errors.append((line, "姓名不能为空"))
+            continue
+        if not is_valid:
+            errors.append((line, f"证件错误：{msg}"))
+            continue
+        is_phone_valid, phone_msg = validate_phone(row["phone"])
+        if not is_phone_valid:
+            errors.append((line, f"手机号错误：{phone_msg}"))
+            continue
+        valid[row["id_card"]] = row
+    return list(valid.values())
+
+def _link_members(reservation_id, user_ids):
+    """关联成员，已在名单中的跳过；返回新增人数"""
+    existing = set(db.session.execute(
+        select(ReservationMember.user_id).where(
+            ReservationMember.reservation_id == reservation_id,
+            ReservationMember.user_id.in_(user_ids),
+        )
+    ).scalars())
+    new_ids = [user_id for user_id in user_ids if user_id not in existing]
+    if new_ids:
+        db.session.execute(
+            ReservationMember.__table__.insert(),
+            [{"reservation_id": reservation_id, "user_id": user_id} for user_id in new_ids],
+        )
+    return len(new_ids)
+
+def _flush_chunk(reservation_id, chunk, errors):
+    rows = _validate_chunk(chunk, errors)
+    if not rows:
+        return 0
+    ids = insert_missing_users(rows)
+    added = _link_members(reservation_id, [ids[row["id_card"]] for row in rows])
+    db.session.commit()
+    return added
+
+def import_roster(reservation_id, stream, chunk_size=200, max_rows=500):
+    """
+    从二进制文件流导入成员名单（UTF-8 编码 CSV，首行为表头）
+    返回 {"rows": 读取行数, "imported": 新增成员数, "errors": [(行号, 原因), ...]}
+    """
+    result = {"rows": 0, "imported": 0, "errors": []}
+    errors = result["errors"]
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    chunk = []
+    try:
+        missing = [name for name in REQUIRED_COLUMNS if name not in (reader.fieldnames or [])]
+        if missing:
+            errors.append((1, f"缺少表头：{'、'.join(missing)}"))
+            return result
+
+        for record in reader:
+            if result["rows"] >= max_rows:
+                errors.append((reader.line_num, f"名单最多 {max_rows} 人，其余行未导入"))
+                break
+            result["rows"] += 1
+            row = {field: (record.get(column) or "").strip() for column, field in ROSTER_COLUMNS.items()}
+            row["id_type"] = row["id_type"] or DEFAULT_ID_TYPE
+            row["line"] = reader.line_num
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                result["imported"] += _flush_chunk(reservation_id, chunk, errors)
+                chunk = []
+    except UnicodeDecodeError:
+        errors.append((reader.line_num + 1, "文件编码错误，请另存为 UTF-8 编码的 CSV"))
+    except csv.Error as e:
+        errors.append((reader.line_num, f"CSV 格式错误：{e}"))
+
+    result["imported"] += _flush_chunk(reservation_id, chunk, errors)
+    del errors[MAX_REPORTED_ERRORS:]
+    return result
@@ -1,11 +1,35 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, session
+import csv
+import hmac
+import io
+import itertools
+import json
+import time
+from datetime import date, datetime, timedelta
+from flask import abort, current_app, Blueprint, get_template_attribute, render_template, request, redirect, url_for, flash, session, jsonify, Response, stream_with_context
 from werkzeug.security import generate_password_hash, check_password_hash
-from sqlalchemy import or_, case
+from sqlalchemy import or_
+from sqlalchemy.orm import contains_eager
 from ..extensions import db
-from ..models import Admin, Reservation, User, Announcement, SystemConfig
+from ..models import Admin, ArchivedReservation, Reservation, User, Announcement, SystemConfig
+from ..counters import status_totals
+from ..audit import audit_reservations, enqueue_audit_notifications, ACTION_STATUS, BATCH_AUDIT_LIMIT, PENDING
+from ..notify import wake_dispatcher
+from ..availability import note_slot_change
+from ..stats import summarize, DIMENSIONS
+from ..pagination import keyset_paginate
+from ..search import match_user_ids
+from ..cache import get_config, get_announcements, get_admin_credential, invalidate
+from ..checkin import get_verifier, load_revoked_bitmap, record_checkin
+from ..metrics import get_registry
+from ..live import get_hub, publish_changes
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 
+# 导出时每批读取/输出的行数
+EXPORT_BATCH_SIZE = 1000
+# 实时推送连接空闲时发送心跳的最长间隔（秒），防止代理断开空闲连接
+LIVE_HEARTBEAT = 15
+
 @admin_bp.before_request
 def check_admin_status():
     if request.endpoint not in ['admin.login', 'admin.logout', 'static']:
@@ -13,15 +37,14 @@ def check_admin_status():
             admin_id = session.get("admin_id")
             security_token = session.get("security_token")
             
-            current_admin = Admin.query.get(admin_id)
+            exists, credential = get_admin_credential(admin_id)
             
-            if not current_admin:
+            if not exists:
                 session.clear()
                 flash("您的账号已被删除，会话中断")
                 return redirect(url_for('admin.login'))
             
-            if current_admin.password_hash and \
-               current_admin.password_hash[-6:] != security_token:
+            if credential and credential != security_token:
                 session.clear()
                 flash("密码已变更，请重新登录")
                 return redirect(url_for('admin.login'))
@@ -43,39 +66,70 @@ def login():
         flash("用户名或密码错误")
     return render_template("admin_login.html")
 
-@admin_bp.route("/dashboard")
-def dashboard():
-    if not session.get("admin_logged_in"):
-        return redirect(url_for("admin.login"))
-
+def _read_filters():
+    """读取列表筛选条件（管理端列表与导出共用）"""
     keyword = request.args.get('keyword', '').strip()
     status_filter = request.args.get('status', '').strip()
-    page = request.args.get('page', 1, type=int)
-    
-    query = Reservation.query.join(User)
+    date_from = request.args.get('date_from', type=date.fromisoformat)
+    date_to = request.args.get('date_to', type=date.fromisoformat)
+    return keyword, status_filter, date_from, date_to
 
+def _filter_reservations(query, keyword, status_filter, date_from, date_to, model=Reservation):
     if keyword:
+        # 先通过 n-gram 索引缩小到候选用户，再做精确匹配
+        candidate_ids = match_user_ids(keyword)
+        if candidate_ids is not None:
+            query = query.filter(model.user_id.in_(candidate_ids))
         query = query.filter(
             or_(
-                User.name.contains(keyword),
+                User.name.icontains(keyword),
                 User.phone.contains(keyword)
             )
         )
+    if status_filter:
+        query = query.filter(model.status == status_filter)
+    if date_from:
+        query = query.filter(model.visit_date >= date_from)
+    if date_to:
+        query = query.filter(model.visit_date <= date_to)
+    return query
+
+@admin_bp.route("/dashboard")
+def dashboard():
+    if not session.get("admin_logged_in"):
+        return redirect(url_for("admin.login"))
+
+    keyword, status_filter, date_from, date_to = _read_filters()
+    page = request.args.get('page', 1, type=int)
+    after = request.args.get('after')
+    before = request.args.get('before')
+
+    query = Reservation.query.join(User).options(contains_eager(Reservation.user))
+    query = _filter_reservations(query, keyword, status_filter, date_from, date_to)
 
+    # 游标分页：待审核优先，再按提交时间倒序；按状态筛选时状态已固定，直接按时间排序
+    totals = status_totals()
     if status_filter:
-        query = query.filter(Reservation.status == status_filter)
+        sort_columns = [Reservation.created_at, Reservation.id]
+        total = totals.get(status_filter, 0)
+    else:
+        sort_columns = [Reservation.audit_priority, Reservation.created_at, Reservation.id]
+        total = sum(totals.values())
 
-    status_order = case(
-        (Reservation.status == '待审核', 0),
-        else_=1
+    pagination = keyset_paginate(
+        query,
+        sort_columns,
+        after=after,
+        before=before,
+        page=page,
+        per_page=10,
+        # 关键字、日期筛选无法由状态计数得出总数，只显示页码
+        total=None if (keyword or date_from or date_to) else total,
     )
-    query = query.order_by(status_order.asc(), Reservation.created_at.desc())
-    
-    pagination = query.paginate(page=page, per_page=10, error_out=False)
     reservations = pagination.items
 
-    announcements = Announcement.query.order_by(Announcement.created_at.desc()).all()
-    config = SystemConfig.query.first()
+    announcements = get_announcements()
+    config = get_config()
 
     admin_list = []
     if session.get("is_super"):
@@ -89,9 +143,200 @@ def dashboard():
         config=config,
         curr_keyword=keyword,
         curr_status=status_filter,
+        curr_date_from=date_from.isoformat() if date_from else '',
+        curr_date_to=date_to.isoformat() if date_to else '',
         admin_list=admin_list
     )
 
+def _render_live_changes(changes):
+    """把 {预约 id: 状态} 渲染成 SSE 数据：每条预约一行 JSON，附带渲染好的表格行"""
+    rows = {
+        res.id: res
+        for res in Reservation.query.join(User)
+        .options(contains_eager(Reservation.user))
+        .filter(Reservation.id.in_(list(changes)))
+    }
+    reservation_row = get_template_attribute("admin_macros.html", "reservation_row")
+    return [
+        json.dumps({"id": res_id, "status": status, "html": str(reservation_row(rows[res_id])) if res_id in rows else None},
+                   ensure_ascii=False)
+        for res_id, status in changes.items()
+    ]
+
+@admin_bp.route("/live")
+def live():
+    """
+    预约列表实时推送（text/event-stream）
+    连接在 LIVE_STREAM_TIMEOUT 秒后主动结束，浏览器按 retry 间隔自动重连并携带 Last-Event-ID 补发期间的变更；
+    重连到其他进程或间隔过久无法补发时推送 resync 事件，由页面提示刷新。
+    """
+    if not session.get("admin_logged_in"):
+        return jsonify(error="未登录"), 401
+
+    hub = get_hub()
+    last_event_id = request.headers.get("Last-Event-ID")
+    seq = hub.parse_event_id(last_event_id)
+    timeout = current_app.config.get("LIVE_STREAM_TIMEOUT", 300)
+    wait = min(hub.poll_interval or LIVE_HEARTBEAT, LIVE_HEARTBEAT)
+
+    def generate():
+        nonlocal seq
+        yield "retry: 3000\n\n"
+        if seq is None:
+            if last_event_id:
+                yield "event: resync\ndata: {}\n\n"
+            seq = hub.last_seq
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            hub.poll()
+            seq, changes = hub.wait(seq, wait)
+            if changes is None:
+                yield f"event: resync\nid: {hub.event_id(seq)}\ndata: {{}}\n\n"
+            elif changes:
+                events = [f"event: reservation\ndata: {line}\n\n" for line in _render_live_changes(changes)]
+                events[-1] = f"id: {hub.event_id(seq)}\n" + events[-1]
+                yield "".join(events)
+            else:
+                yield ": keepalive\n\n"
+            # 等待期间不占用数据库连接
+            db.session.close()
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+EXPORT_COLUMNS = [
+    ("提交时间", lambda r: r.created_at.strftime('%Y-%m-%d %H:%M:%S') if r.created_at else ""),
+    ("姓名", lambda r: r.name),
+    ("证件类型", lambda r: r.id_type),
+    ("证件号码", lambda r: r.id_card),
+    ("手机号", lambda r: r.phone),
+    ("身份", lambda r: r.identity),
+    ("预约类型", lambda r: r.res_type),
+    ("校区", lambda r: r.area),
+    ("参观日期", lambda r: r.visit_date.isoformat() if r.visit_date else ""),
+    ("时间段", lambda r: r.visit_time),
+    ("预约缘由", lambda r: r.reason),
+    ("状态", lambda r: r.status),
+    ("拒绝理由", lambda r: r.reject_reason),
+]
+
+def _csv_safe(value):
+    """防止 CSV 公式注入：以 = + - @ 开头的文本前加单引号"""
+    value = "" if value is None else str(value)
+    if value[:1] in ("=", "+", "-", "@"):
+        return "'" + value
+    return value
+
+@admin_bp.route("/export")
+def export():
+    """按当前筛选条件导出预约记录（CSV，流式输出）"""
+    if not session.get("admin_logged_in"):
+        return redirect(url_for("admin.login"))
+
+    keyword, status_filter, date_from, date_to = _read_filters()
+
+    def export_query(model):
+        query = db.session.query(
+            model.created_at,
+            model.identity,
+            model.res_type,
+            model.area,
+            model.visit_date,
+            model.visit_time,
+            model.reason,
+            model.status,
+            model.reject_reason,
+            User.name,
+            User.id_type,
+            User.id_card,
+            User.phone,
+        ).join(User, model.user_id == User.id)
+        query = _filter_reservations(query, keyword, status_filter, date_from, date_to, model)
+        # 服务端游标分批读取，导出全年数据也只占用固定内存
+        return query.order_by(model.id).yield_per(EXPORT_BATCH_SIZE)
+
+    # 先导出已归档的历史预约，再导出热表中的预约（按日期筛选时归档表走 visit_date 索引）
+    rows = itertools.chain(export_query(ArchivedReservation), export_query(Reservation))
+
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffer.write("\ufeff")  # BOM，保证 Excel 直接打开不乱码
+        writer.writerow([title for title, _ in EXPORT_COLUMNS])
+        for index, row in enumerate(rows, 1):
+            writer.writerow([_csv_safe(getter(row)) for _, getter in EXPORT_COLUMNS])
+            if index % EXPORT_BATCH_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+        yield buffer.getvalue()
+
+    filename = f"reservations_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+def _read_stats_params():
+    """统计查询参数：默认统计最近 30 天至未来 30 天"""
+    today = date.today()
+    date_from = request.args.get('date_from', type=date.fromisoformat) or today - timedelta(days=30)
+    date_to = request.args.get('date_to', type=date.fromisoformat) or today + timedelta(days=30)
+    granularity = request.args.get('granularity', 'day')
+    if granularity not in ('day', 'week'):
+        granularity = 'day'
+    dimension = request.args.get('dimension', '')
+    if dimension not in DIMENSIONS:
+        dimension = ''
+    return date_from, date_to, granularity, dimension
+
+@admin_bp.route("/stats")
+def stats():
+    if not session.get("admin_logged_in"):
+        return redirect(url_for("admin.login"))
+
+    date_from, date_to, granularity, dimension = _read_stats_params()
+    result = summarize(date_from, date_to, granularity, dimension or None)
+    return render_template(
+        "admin_stats.html",
+        result=result,
+        dimensions=DIMENSIONS,
+        curr_date_from=date_from.isoformat(),
+        curr_date_to=date_to.isoformat(),
+        curr_granularity=granularity,
+        curr_dimension=dimension,
+    )
+
+@admin_bp.route("/api/stats")
+def stats_api():
+    if not session.get("admin_logged_in"):
+        return jsonify(error="未登录"), 401
+
+    date_from, date_to, granularity, dimension = _read_stats_params()
+    result = summarize(date_from, date_to, granularity, dimension or None)
+    return jsonify(
+        date_from=date_from.isoformat(),
+        date_to=date_to.isoformat(),
+        granularity=granularity,
+        dimension=dimension or None,
+        **result,
+    )
+
+def _after_audit_commit(updated, action, promoted):
+    """审核事务提交后：更新余量日历、推送列表变更并唤醒通知发送"""
+    if action == "reject":
+        for row in updated:
+            note_slot_change(row.area, row.visit_date, row.visit_time, -1)
+        for res in promoted:
+            note_slot_change(res.area, res.visit_date, res.visit_time, 1)
+    publish_changes([row.id for row in updated], ACTION_STATUS[action])
+    publish_changes([res.id for res in promoted], PENDING)
+    wake_dispatcher()
+
 @admin_bp.route("/audit/<int:res_id>", methods=["POST"])
 def audit(res_id):
     if not session.get("admin_logged_in"):
@@ -99,22 +344,62 @@ def audit(res_id):
     action = request.form.get("action")
     reject_reason = request.form.get("reject_reason", "")
 
-    res = Reservation.query.get(res_id)
-    if res.status != '待审核':
-        flash(f"操作被忽略：该预约已被处理 (当前状态: {res.status})")
+    if action not in ACTION_STATUS:
+        flash("无效的审核操作")
         return redirect(url_for("admin.dashboard"))
 
-    if action == "approve":
-        res.status = "已同意"
-        print(f"【模拟微信通知】预约已同意。注意事项：请携带身份证入馆。")
-    elif action == "reject":
-        res.status = "已拒绝"
-        res.reject_reason = reject_reason
-        print(f"【模拟微信通知】预约被拒绝。原因：{reject_reason}")
+    updated, results, promoted = audit_reservations([res_id], action, reject_reason)
+    result, current_status = results[res_id]
+    if result == "not_found":
+        flash("操作被忽略：该预约不存在")
+        return redirect(url_for("admin.dashboard"))
+    if result == "skipped":
+        flash(f"操作被忽略：该预约已被处理 (当前状态: {current_status})")
+        return redirect(url_for("admin.dashboard"))
 
+    enqueue_audit_notifications(updated, action, reject_reason)
     db.session.commit()
+    _after_audit_commit(updated, action, promoted)
     return redirect(url_for("admin.dashboard"))
 
+@admin_bp.route("/audit/batch", methods=["POST"])
+def audit_batch():
+    """批量审核接口，JSON: {"ids": [...], "action": "approve|reject", "reject_reason": ""}"""
+    if not session.get("admin_logged_in"):
+        return jsonify(error="未登录"), 401
+
+    data = request.get_json(silent=True) or {}
+    action = data.get("action") or request.form.get("action")
+    reject_reason = data.get("reject_reason") or request.form.get("reject_reason", "")
+    raw_ids = data.get("ids") or request.form.getlist("ids")
+
+    if action not in ACTION_STATUS:
+        return jsonify(error="无效的审核操作"), 400
+    if action == "reject" and not reject_reason.strip():
+        return jsonify(error="请填写拒绝理由"), 400
+    try:
+        res_ids = [int(x) for x in raw_ids]
+    except (TypeError, ValueError):
+        return jsonify(error="预约编号格式错误"), 400
+    if not res_ids:
+        return jsonify(error="请选择需要审核的预约"), 400
+    if len(res_ids) > BATCH_AUDIT_LIMIT:
+        return jsonify(error=f"单次最多审核 {BATCH_AUDIT_LIMIT} 条"), 400
+
+    updated, results, promoted = audit_reservations(res_ids, action, reject_reason)
+    enqueue_audit_notifications(updated, action, reject_reason)
+    db.session.commit()
+    _after_audit_commit(updated, action, promoted)
+
+    return jsonify(
+        updated=len(updated),
+        promoted=len(promoted),
+        results=[
+            {"id": res_id, "result": result, "status": status}
+            for res_id, (result, status) in results.items()
+        ],
+    )
+
 @admin_bp.route("/config", methods=["POST"])
 def config():
     if not session.get("admin_logged_in"):
@@ -128,7 +413,9 @@ def config():
     if "update_config" in request.form:
         config.campuses = request.form.get("campuses")
         config.visit_times = request.form.get("visit_times")
-        config.daily_limit = request.form.get("daily_limit")
+        daily_limit = request.form.get("daily_limit", type=int)
+        if daily_limit is not None and daily_limit >= 0:
+            config.daily_limit = daily_limit
 
     if "update_policy" in request.form:
         config.privacy_policy = request.form.get("privacy_policy")
@@ -141,6 +428,7 @@ def config():
         db.session.add(new_notice)
 
     db.session.commit()
+    invalidate()
     return redirect(url_for("admin.dashboard"))
 
 @admin_bp.route("/account", methods=["POST"])
@@ -163,6 +451,7 @@ def account():
 
             current_admin.password_hash = generate_password_hash(new_pass)
             db.session.commit()
+            invalidate()
             flash("您的密码已修改，请重新登录")
             session.clear()
             return redirect(url_for("admin.login"))
@@ -188,6 +477,7 @@ def account():
         if target and not target.is_super:
             db.session.delete(target)
             db.session.commit()
+            invalidate()
             flash("管理员已删除")
         else:
             flash("删除失败：无法删除超级管理员或用户不存在")
@@ -199,10 +489,51 @@ def account():
         if target:
             target.password_hash = generate_password_hash(new_pass)
             db.session.commit()
+            invalidate()
             flash(f"管理员 {target.username} 的密码已重置")
 
     return redirect(url_for("admin.dashboard"))
 
+@admin_bp.route("/checkin", methods=["GET", "POST"])
+def checkin():
+    """入馆核验：扫码枪读入入馆码后提交，只校验签名、日期与撤销位图，签到记录异步写入"""
+    if not session.get("admin_logged_in"):
+        if request.method == "POST":
+            return jsonify(error="未登录"), 401
+        return redirect(url_for("admin.login"))
+    if request.method == "GET":
+        return render_template("admin_checkin.html")
+
+    data = request.get_json(silent=True) or {}
+    token = (data.get("token") or request.form.get("token") or "").strip()
+    gate = (data.get("gate") or request.form.get("gate") or "")[:50] or None
+    ok, message, res_id = get_verifier().verify(token)
+    if ok:
+        record_checkin(res_id, gate)
+    return jsonify(ok=ok, message=message, reservation_id=res_id)
+
+@admin_bp.route("/checkin/revoked")
+def checkin_revoked():
+    """供离线核验端定期同步的撤销位图（zlib 压缩），支持 ETag 条件请求"""
+    if not session.get("admin_logged_in"):
+        return jsonify(error="未登录"), 401
+    response = Response(load_revoked_bitmap().to_bytes(), mimetype="application/octet-stream")
+    response.add_etag()
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request)
+
+@admin_bp.route("/metrics")
+def metrics():
+    """各端点的 SQL 条数、数据库/渲染耗时与疑似 N+1 统计（Prometheus 文本格式）"""
+    registry = get_registry()
+    if registry is None:
+        abort(404)
+    token = current_app.config.get("METRICS_TOKEN")
+    authorized = token and hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}")
+    if not (authorized or session.get("admin_logged_in")):
+        return Response("未登录\n", status=401, mimetype="text/plain")
+    return Response(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
 @admin_bp.route("/logout")
 def logout():
     session.clear()
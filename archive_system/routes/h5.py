@@ -1,7 +1,26 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, session
+import uuid
+from datetime import date, datetime
+from flask import abort, Blueprint, render_template, request, redirect, url_for, flash, session, jsonify, Response, current_app
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager
 from ..extensions import db
-from ..models import User, SystemConfig, Announcement, Reservation
+from ..models import User, Reservation, ReservationMember
 from ..validators import validate_certificate, validate_phone, validate_visit_date
+from ..capacity import acquire_slot
+from ..counters import bump_status
+from ..stats import record_new_reservation
+from ..search import index_user
+from ..cache import get_config
+from ..notify import enqueue, wake_dispatcher
+from ..availability import get_calendar, note_slot_change
+from ..ratelimit import allow
+from ..roster import import_roster, ROSTER_COLUMNS
+from ..users import login_user
+from ..checkin import issue_token, APPROVED, REVOKED_STATUSES
+from ..archive import user_history, has_archived
+from ..audit import cancel_reservation, CANCELLED, PENDING
+from ..live import publish_changes
+from ..waitlist import join_waitlist, leave_waitlist, queue_position, waiting_entries
 
 h5_bp = Blueprint('h5', __name__)
 
@@ -21,34 +40,23 @@ def login():
         phone = request.form.get("phone").strip()
 
         is_phone_valid, phone_msg = validate_phone(phone)
-        config = SystemConfig.query.first()
         if not is_phone_valid:
             flash(f"手机号错误：{phone_msg}")
-            return render_template("h5_login.html", prev_name=name, prev_phone=phone, prev_id_card=id_card, prev_id_type=id_type, privacy_policy=config.privacy_policy)
+            return render_template("h5_login.html", prev_name=name, prev_phone=phone, prev_id_card=id_card, prev_id_type=id_type)
         
         is_valid, err_msg = validate_certificate(id_type, id_card)
         if not is_valid:
             flash(f"证件错误：{err_msg}")
-            return render_template("h5_login.html", prev_name=name, prev_phone=phone, prev_id_card=id_card, prev_id_type=id_type, privacy_policy=config.privacy_policy)
+            return render_template("h5_login.html", prev_name=name, prev_phone=phone, prev_id_card=id_card, prev_id_type=id_type)
         
-        user = User.query.filter_by(id_card=id_card).first()
-
-        if not user:
-            user = User(id_type=id_type, id_card=id_card, name=name, phone=phone)
-            db.session.add(user)
-            db.session.commit()
-        else:
-            user.name = name
-            user.phone = phone
-            user.id_type = id_type
+        user_id, written = login_user({"id_type": id_type, "id_card": id_card, "name": name, "phone": phone})
+        if written:
             db.session.commit()
 
-        session["user_id"] = user.id
+        session["user_id"] = user_id
         return redirect(url_for("h5.home"))
 
-    config = SystemConfig.query.first()
-    policy_text = config.privacy_policy if config else "<p>暂无内容</p>"
-    return render_template("h5_login.html", privacy_policy=policy_text)
+    return render_template("h5_login.html")
 
 @h5_bp.route("/h5/home")
 def home():
@@ -56,26 +64,52 @@ def home():
         return redirect(url_for("h5.login"))
 
     user = User.query.get(session["user_id"])
-    all_announcements = Announcement.query.order_by(Announcement.created_at.desc()).all()
-    config = SystemConfig.query.first()
+    config = get_config()
+    # 公告列表由模板片段缓存渲染
     return render_template(
         "h5_home.html", 
         user=user, 
-        all_announcements=all_announcements,
         config=config
     )
 
+def _render_reserve_form(config, status=200):
+    """渲染预约表单，每次渲染生成新的幂等键"""
+    campuses = config.campuses.split(",")
+    times = config.visit_times.split(",")
+    user = User.query.get(session["user_id"])
+    return render_template(
+        "h5_reserve.html",
+        user=user,
+        campuses=campuses,
+        times=times,
+        idempotency_key=uuid.uuid4().hex,
+    ), status
+
 @h5_bp.route("/h5/reserve", methods=["GET", "POST"])
 def reserve():
     if "user_id" not in session:
         return redirect(url_for("h5.login"))
 
-    config = SystemConfig.query.first()
+    config = get_config()
     if not config.is_open:
         flash("系统维护中，暂时关闭预约")
         return redirect(url_for("h5.home"))
 
     if request.method == "POST":
+        user_id = session["user_id"]
+        if not (
+            allow(f"reserve:user:{user_id}", current_app.config["RESERVE_USER_BUCKET"])
+            and allow(f"reserve:ip:{request.remote_addr}", current_app.config["RESERVE_IP_BUCKET"])
+        ):
+            flash("操作过于频繁，请稍后再试")
+            return _render_reserve_form(config, 429)
+
+        # 同一表单重复提交（网络慢时连点）：一次索引查询后直接返回结果
+        idempotency_key = (request.form.get("idempotency_key") or "").strip()[:64] or None
+        if idempotency_key and _is_duplicate_submission(idempotency_key, user_id):
+            flash("预约提交成功，请等待审核通知")
+            return redirect(url_for("h5.history"))
+
         area = request.form.get("area")
         visit_date = request.form.get("visit_date")
         visit_time = request.form.get("visit_time")
@@ -86,42 +120,198 @@ def reserve():
         is_date_valid, date_msg = validate_visit_date(visit_date)
         if not is_date_valid:
             flash(date_msg)
-            campuses = config.campuses.split(",")
-            times = config.visit_times.split(",")
-            user = User.query.get(session["user_id"])
-            return render_template("h5_reserve.html", user=user, campuses=campuses, times=times)
+            return _render_reserve_form(config)
+
+        visit_date = datetime.strptime(visit_date, "%Y-%m-%d").date()
+        campuses = config.campuses.split(",")
+        times = config.visit_times.split(",")
+        if area not in campuses or visit_time not in times:
+            flash("预约信息错误：校区或时间段不在开放范围内")
+            return _render_reserve_form(config)
+
+        active_key = Reservation.make_active_key(user_id, visit_date, visit_time)
+        if Reservation.query.filter_by(active_key=active_key).with_entities(Reservation.id).first():
+            flash("您已预约该日期的该时段，请勿重复预约")
+            return _render_reserve_form(config)
+
+        # 名额占用与预约记录在同一事务中提交，并发提交也不会超出每日限额
+        if not acquire_slot(area, visit_date, visit_time, config.daily_limit):
+            db.session.rollback()
+            if request.form.get("join_waitlist"):
+                return _join_waitlist(user_id, area, visit_date, visit_time, reason, res_type, identity)
+            flash("该时段预约名额已满，请选择其他日期或时间段，或勾选“名额已满时加入候补”")
+            return _render_reserve_form(config)
 
         res = Reservation(
-            user_id=session["user_id"],
+            user_id=user_id,
             area=area,
             visit_date=visit_date,
             visit_time=visit_time,
             reason=reason,
             res_type=res_type,
             identity=identity,
+            idempotency_key=idempotency_key,
+            active_key=active_key,
         )
         db.session.add(res)
-        db.session.commit()
+        bump_status("待审核")
+        record_new_reservation(res)
+        enqueue("submitted", user_id, f"用户 {user_id} 预约提交成功，等待审核。", reservation=res)
+        try:
+            # 先 flush 取得 id，提交后不必为推送再次读取该行
+            db.session.flush()
+            res_id = res.id
+            db.session.commit()
+        except IntegrityError:
+            # 并发的重复提交被唯一索引拦截，本事务（含名额占用）整体回滚
+            db.session.rollback()
+            if idempotency_key and _is_duplicate_submission(idempotency_key, user_id):
+                flash("预约提交成功，请等待审核通知")
+                return redirect(url_for("h5.history"))
+            flash("您已预约该日期的该时段，请勿重复预约")
+            return _render_reserve_form(config)
+
+        note_slot_change(area, visit_date, visit_time, 1)
+        publish_changes([res_id], PENDING)
+        wake_dispatcher()
 
-        print(f"【模拟微信通知】用户 {session['user_id']} 预约提交成功，等待审核。")
         flash("预约提交成功，请等待审核通知")
         return redirect(url_for("h5.history"))
 
-    campuses = config.campuses.split(",")
-    times = config.visit_times.split(",")
-    user = User.query.get(session["user_id"])
-    return render_template("h5_reserve.html", user=user, campuses=campuses, times=times)
+    return _render_reserve_form(config)
+
+def _join_waitlist(user_id, area, visit_date, visit_time, reason, res_type, identity):
+    """名额已满时排入候补队列，名额释放后自动转为预约"""
+    entry = join_waitlist(user_id, area, visit_date, visit_time, reason, res_type, identity)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        flash("该时段名额已满，您已在候补队列中，请耐心等待")
+        return redirect(url_for("h5.history"))
+    flash(f"该时段名额已满，已为您加入候补队列（第 {queue_position(entry)} 位），有空余名额时将自动提交预约")
+    return redirect(url_for("h5.history"))
+
+def _is_duplicate_submission(idempotency_key, user_id):
+    return (
+        Reservation.query.filter_by(idempotency_key=idempotency_key, user_id=user_id)
+        .with_entities(Reservation.id)
+        .first()
+        is not None
+    )
+
+@h5_bp.route("/h5/api/availability")
+def availability():
+    """未来 N 天各校区/日期/时段的剩余名额，支持 ETag 条件请求"""
+    if "user_id" not in session:
+        return jsonify(error="未登录"), 401
+
+    days = request.args.get("days", 14, type=int)
+    etag, body = get_calendar().snapshot(days, get_config())
+    response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request)
 
 @h5_bp.route("/h5/history")
 def history():
     if "user_id" not in session:
         return redirect(url_for("h5.login"))
-    reservations = (
-        Reservation.query.filter_by(user_id=session["user_id"])
-        .order_by(Reservation.created_at.desc())
+    # 默认只读近期预约；较早的归档记录按需加载
+    include_archived = request.args.get("archived") == "1"
+    reservations = user_history(session["user_id"], include_archived)
+    waiting = [(entry, queue_position(entry)) for entry in waiting_entries(session["user_id"])]
+    return render_template(
+        "h5_history.html",
+        reservations=reservations,
+        waiting=waiting,
+        today=date.today(),
+        include_archived=include_archived,
+        has_archived=not include_archived and has_archived(session["user_id"]),
+    )
+
+@h5_bp.route("/h5/reservation/<int:res_id>/cancel", methods=["POST"])
+def cancel(res_id):
+    """访客取消预约，释放的名额自动转给候补队首"""
+    if "user_id" not in session:
+        return redirect(url_for("h5.login"))
+    res, promoted = cancel_reservation(res_id, session["user_id"], date.today())
+    if res is None:
+        flash("该预约无法取消")
+        return redirect(url_for("h5.history"))
+    db.session.commit()
+    note_slot_change(res.area, res.visit_date, res.visit_time, -1)
+    for item in promoted:
+        note_slot_change(item.area, item.visit_date, item.visit_time, 1)
+    publish_changes([res.id], CANCELLED)
+    publish_changes([item.id for item in promoted], PENDING)
+    wake_dispatcher()
+    flash("预约已取消")
+    return redirect(url_for("h5.history"))
+
+@h5_bp.route("/h5/waitlist/<int:entry_id>/cancel", methods=["POST"])
+def cancel_waitlist(entry_id):
+    if "user_id" not in session:
+        return redirect(url_for("h5.login"))
+    if leave_waitlist(entry_id, session["user_id"]):
+        db.session.commit()
+        flash("已退出候补")
+    else:
+        flash("该候补记录已处理")
+    return redirect(url_for("h5.history"))
+
+@h5_bp.route("/h5/reservation/<int:res_id>/roster", methods=["GET", "POST"])
+def roster(res_id):
+    """团队预约成员名单：领队上传 CSV 批量登记成员"""
+    if "user_id" not in session:
+        return redirect(url_for("h5.login"))
+    res = Reservation.query.filter_by(id=res_id, user_id=session["user_id"]).first()
+    if not res:
+        abort(404)
+    if res.res_type != "团队":
+        flash("仅团队预约需要上传成员名单")
+        return redirect(url_for("h5.history"))
+
+    errors = []
+    if request.method == "POST":
+        upload = request.files.get("roster")
+        if res.status in REVOKED_STATUSES:
+            flash("该预约已被拒绝或取消，无法修改成员名单")
+        elif not upload or not upload.filename:
+            flash("请选择要上传的名单文件")
+        else:
+            result = import_roster(
+                res.id,
+                upload.stream,
+                chunk_size=current_app.config["ROSTER_CHUNK_SIZE"],
+                max_rows=current_app.config["ROSTER_MAX_ROWS"],
+            )
+            errors = result["errors"]
+            flash(f"共读取 {result['rows']} 行，新增成员 {result['imported']} 人")
+
+    members = (
+        ReservationMember.query.filter_by(reservation_id=res.id)
+        .join(ReservationMember.user)
+        .options(contains_eager(ReservationMember.user))
+        .order_by(ReservationMember.created_at, User.id)
         .all()
     )
-    return render_template("h5_history.html", reservations=reservations)
+    return render_template(
+        "h5_roster.html", res=res, members=members, errors=errors, columns=list(ROSTER_COLUMNS)
+    )
+
+@h5_bp.route("/h5/reservation/<int:res_id>/ticket")
+def ticket(res_id):
+    """入馆码：已同意的预约在参观当日出示，由入口扫码核验"""
+    if "user_id" not in session:
+        return redirect(url_for("h5.login"))
+    res = Reservation.query.filter_by(id=res_id, user_id=session["user_id"]).first()
+    if not res:
+        abort(404)
+    if res.status != APPROVED:
+        flash("预约审核通过后才能查看入馆码")
+        return redirect(url_for("h5.history"))
+    return render_template("h5_ticket.html", res=res, token=issue_token(res))
 
 @h5_bp.route("/h5/profile", methods=["GET", "POST"])
 def profile():
@@ -138,8 +328,11 @@ def profile():
             flash(f"手机号错误：{phone_msg}")
             return render_template("h5_profile.html", user=user)
         
+        search_changed = (user.name, user.phone) != (name, phone)
         user.name = name
         user.phone = phone
+        if search_changed:
+            index_user(user)
         db.session.commit()
         flash("个人信息已更新")
         return redirect(url_for("h5.home"))
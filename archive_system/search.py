@@ -0,0 +1,109 @@
+"""
+管理端关键字搜索索引
+LIKE '%关键字%' 无法使用索引，这里为每个用户维护一张 n-gram 表：
+- 姓名：1-gram + 2-gram（中文姓名通常 2~4 个字，按姓氏单字也能检索），统一转为小写，英文姓名检索不区分大小写
+- 手机号：3-gram（按号段、尾号等片段检索）
+查询时先用 gram 表定位候选用户，再对候选用户做精确的包含判断。
+"""
+from sqlalchemy import select, func, insert
+from .extensions import db
+from .models import User, UserSearchGram
+
+NAME_PREFIX = "n:"
+PHONE_PREFIX = "p:"
+PHONE_GRAM = 3
+
+def _ngrams(text, n):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+def user_grams(name, phone):
+    """计算某个用户需要写入索引的全部 gram"""
+    grams = set()
+    name = (name or "").strip().lower()
+    phone = (phone or "").strip()
+    for n in (1, 2):
+        grams.update(NAME_PREFIX + g for g in _ngrams(name, n))
+    grams.update(PHONE_PREFIX + g for g in _ngrams(phone, PHONE_GRAM))
+    return grams
+
+def index_user(user):
+    """在当前事务中重建某个用户的索引（新建用户需先 flush 拿到 id）"""
+    db.session.query(UserSearchGram).filter_by(user_id=user.id).delete(synchronize_session=False)
+    db.session.add_all(
+        UserSearchGram(gram=gram, user_id=user.id) for gram in user_grams(user.name, user.phone)
+    )
+
+def index_users(rows):
+    """批量重建多个用户的索引，rows 为 (user_id, name, phone) 序列"""
+    rows = list(rows)
+    if not rows:
+        return
+    db.session.query(UserSearchGram).filter(
+        UserSearchGram.user_id.in_([user_id for user_id, _, _ in rows])
+    ).delete(synchronize_session=False)
+    values = [
+        {"gram": gram, "user_id": user_id}
+        for user_id, name, phone in rows
+        for gram in user_grams(name, phone)
+    ]
+    if values:
+        db.session.execute(insert(UserSearchGram), values)
+
+def keyword_grams(keyword):
+    """
+    将搜索关键字拆成 gram
+    返回 None 表示关键字过短无法走索引（例如 1~2 位数字），调用方需回退到 LIKE
+    """
+    keyword = keyword.strip().lower()
+    if not keyword:
+        return None
+    if keyword.isdigit():
+        if len(keyword) < PHONE_GRAM:
+            return None
+        return {PHONE_PREFIX + g for g in _ngrams(keyword, PHONE_GRAM)}
+    if len(keyword) == 1:
+        return {NAME_PREFIX + keyword}
+    return {NAME_PREFIX + g for g in _ngrams(keyword, 2)}
+
+def match_user_ids(keyword):
+    """
+    返回命中全部 gram 的候选用户 id 子查询；无法走索引时返回 None
+    候选结果可能包含少量误命中，调用方仍需叠加精确的包含条件
+    """
+    grams = keyword_grams(keyword)
+    if not grams:
+        return None
+    return (
+        select(UserSearchGram.user_id)
+        .where(UserSearchGram.gram.in_(grams))
+        .group_by(UserSearchGram.user_id)
+        .having(func.count(UserSearchGram.gram) == len(grams))
+    )
+
+def has_stale_grams():
+    """索引中是否还有未转小写的姓名 gram（引入大小写归一之前建立的索引）"""
+    return db.session.query(
+        select(UserSearchGram.gram)
+        .where(UserSearchGram.gram.startswith(NAME_PREFIX), UserSearchGram.gram != func.lower(UserSearchGram.gram))
+        .exists()
+    ).scalar()
+
+def rebuild_user_index(batch_size=1000):
+    """分批重建全部用户的检索索引"""
+    db.session.query(UserSearchGram).delete()
+    db.session.commit()
+
+    last_id = 0
+    total = 0
+    while True:
+        users = User.query.filter(User.id > last_id).order_by(User.id).limit(batch_size).all()
+        if not users:
+            break
+        for user in users:
+            db.session.add_all(
+                UserSearchGram(gram=gram, user_id=user.id) for gram in user_grams(user.name, user.phone)
+            )
+        db.session.commit()
+        last_id = users[-1].id
+        total += len(users)
+    return total
@@ -0,0 +1,145 @@
+"""
+预约统计汇总
+reservation_daily_stat 在预约提交、审核状态流转时与业务数据同一事务增量更新，
+统计页面与接口只读取汇总表，不对 reservation 做 GROUP BY。
+"""
+from collections import Counter, defaultdict
+from datetime import timedelta
+from sqlalchemy import update, func, select, union_all
+from sqlalchemy.exc import IntegrityError
+from .extensions import db
+from .models import ArchivedReservation, Reservation, ReservationDailyStat
+
+# 统计页面可选的细分维度
+DIMENSIONS = {
+    "area": "校区",
+    "visit_time": "时间段",
+    "res_type": "预约类型",
+    "identity": "访客身份",
+}
+STATUS_KEYS = {"待审核": "pending", "已同意": "approved", "已拒绝": "rejected", "已取消": "cancelled"}
+
+def _dims(visit_date, area, visit_time, res_type, identity):
+    return {
+        "visit_date": visit_date,
+        "area": area or "",
+        "visit_time": visit_time or "",
+        "res_type": res_type or "",
+        "identity": identity or "",
+    }
+
+def bump_daily_stat(dims, status, delta):
+    """在当前事务中调整某个统计维度的计数"""
+    if dims["visit_date"] is None or not delta:
+        return
+    filters = [getattr(ReservationDailyStat, key) == value for key, value in dims.items()]
+    result = db.session.execute(
+        update(ReservationDailyStat)
+        .where(*filters, ReservationDailyStat.status == status)
+        .values(count=ReservationDailyStat.count + delta)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        return
+
+    try:
+        with db.session.begin_nested():
+            db.session.add(ReservationDailyStat(status=status, count=delta, **dims))
+    except IntegrityError:
+        bump_daily_stat(dims, status, delta)
+
+def record_new_reservation(res):
+    """新预约提交时计入汇总"""
+    dims = _dims(res.visit_date, res.area, res.visit_time, res.res_type, res.identity)
+    bump_daily_stat(dims, res.status or "待审核", 1)
+
+def record_transition(rows, old_status, new_status):
+    """一批预约状态流转时同步汇总（rows 需包含 visit_date/area/visit_time/res_type/identity）"""
+    groups = Counter(
+        tuple(_dims(r.visit_date, r.area, r.visit_time, r.res_type, r.identity).items())
+        for r in rows
+    )
+    for dims, count in groups.items():
+        dims = dict(dims)
+        bump_daily_stat(dims, old_status, -count)
+        bump_daily_stat(dims, new_status, count)
+
+def rebuild_daily_stats(batch_size=1000):
+    """根据预约记录（含已归档预约）重建统计汇总（回填历史数据）"""
+    names = ("visit_date", "area", "visit_time", "res_type", "identity", "status")
+    source = union_all(
+        *(select(*(getattr(model, name) for name in names)) for model in (Reservation, ArchivedReservation))
+    ).subquery()
+    group_columns = tuple(source.c[name] for name in names)
+    rows = (
+        db.session.query(*group_columns, func.count())
+        .filter(source.c.visit_date.isnot(None))
+        .group_by(*group_columns)
+        .yield_per(batch_size)
+    )
+
+    db.session.query(ReservationDailyStat).delete()
+    total = 0
+    batch = []
+    for visit_date, area, visit_time, res_type, identity, status, count in rows:
+        dims = _dims(visit_date, area, visit_time, res_type, identity)
+        batch.append(ReservationDailyStat(status=status or "待审核", count=count, **dims))
+        if len(batch) >= batch_size:
+            db.session.add_all(batch)
+            db.session.flush()
+            total += len(batch)
+            batch = []
+    db.session.add_all(batch)
+    total += len(batch)
+    db.session.commit()
+    return total
+
+def _period_of(visit_date, granularity):
+    if granularity == "week":
+        return visit_date - timedelta(days=visit_date.weekday())  # 以周一代表该周
+    return visit_date
+
+def summarize(date_from, date_to, granularity="day", dimension=None):
+    """
+    读取汇总表生成统计结果
+    - granularity: day / week
+    - dimension: 细分维度（DIMENSIONS 中的键），为空时不细分
+    返回: {"rows": [...], "summary": {...}}
+    """
+    columns = [ReservationDailyStat.visit_date, ReservationDailyStat.status]
+    if dimension:
+        columns.append(getattr(ReservationDailyStat, dimension))
+    rows = (
+        db.session.query(*columns, func.sum(ReservationDailyStat.count))
+        .filter(
+            ReservationDailyStat.visit_date >= date_from,
+            ReservationDailyStat.visit_date <= date_to,
+        )
+        .group_by(*columns)
+        .all()
+    )
+
+    buckets = defaultdict(Counter)
+    for row in rows:
+        visit_date, status = row[0], row[1]
+        label = row[2] if dimension else ""
+        buckets[(_period_of(visit_date, granularity), label)][STATUS_KEYS.get(status, status)] += row[-1]
+
+    def finish(counts):
+        item = {key: counts.get(key, 0) for key in STATUS_KEYS.values()}
+        item["total"] = sum(item.values())
+        audited = item["approved"] + item["rejected"]
+        item["approval_rate"] = round(item["approved"] / audited, 4) if audited else None
+        return item
+
+    result_rows = []
+    summary = Counter()
+    for (period, label), counts in sorted(buckets.items()):
+        item = {"period": period.isoformat()}
+        if dimension:
+            item[dimension] = label
+        item.update(finish(counts))
+        result_rows.append(item)
+        summary.update(counts)
+
+    return {"rows": result_rows, "summary": finish(summary)}
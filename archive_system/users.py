@@ -0,0 +1,87 @@
+"""
+访客账户写入
+按证件号批量 upsert：一条 INSERT ... ON CONFLICT 语句完成插入或更新，
+只有字段确有变化的行才会被改写，并同步维护管理端检索索引。
+团队名单等代填场景只插入新用户，不改写已有用户的资料。
+登录场景下绝大多数是资料未变的老用户，先做一次只读查询，确有变化才执行 upsert，
+避免每次登录都抢占 SQLite 唯一的写锁。
+"""
+from sqlalchemy import select, or_
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from .extensions import db
+from .models import User
+from .search import index_users
+
+USER_FIELDS = ("id_type", "name", "phone")
+
+def _upsert_statement(values, update=True):
+    """
+    构造按 id_card 冲突处理的语句：update 为真时更新有变化的字段，否则保留已有用户不动
+    支持 RETURNING 时返回被写入的行
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = insert(User).values(values)
+        if update:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[User.id_card],
+                set_={field: stmt.excluded[field] for field in USER_FIELDS},
+                where=or_(*(getattr(User, field) != stmt.excluded[field] for field in USER_FIELDS)),
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[User.id_card])
+        return stmt.returning(User.id, User.id_card, User.name, User.phone), True
+    if dialect == "mysql":
+        stmt = mysql.insert(User).values(values)
+        if update:
+            return stmt.on_duplicate_key_update({field: stmt.inserted[field] for field in USER_FIELDS}), False
+        return stmt.prefix_with("IGNORE"), False
+    raise NotImplementedError(f"不支持的数据库类型：{dialect}")
+
+def _write_users(values, update):
+    if not values:
+        return {}
+    stmt, returning = _upsert_statement(values, update)
+    result = db.session.execute(stmt)
+    id_cards = [value["id_card"] for value in values]
+    if returning:
+        # 只返回新插入或字段有变化的行，只有这些行需要重建索引
+        written = result.all()
+    else:
+        written = db.session.execute(
+            select(User.id, User.id_card, User.name, User.phone).where(User.id_card.in_(id_cards))
+        ).all()
+    index_users((row.id, row.name, row.phone) for row in written)
+
+    ids = {row.id_card: row.id for row in written}
+    missing = [id_card for id_card in id_cards if id_card not in ids]
+    if missing:
+        ids.update(db.session.execute(select(User.id_card, User.id).where(User.id_card.in_(missing))).all())
+    return ids
+
+def upsert_users(values):
+    """
+    批量写入用户，values 为 {id_type, id_card, name, phone} 字典列表（id_card 不可重复）
+    已有用户的资料会被更新，只用于本人登录；返回 {id_card: user_id}，调用方负责提交事务
+    """
+    return _write_users(values, update=True)
+
+def insert_missing_users(values):
+    """
+    批量登记用户：只插入尚不存在的证件号，已有用户的姓名、手机号保持不变
+    （由他人代填的数据不能改写访客本人的资料），返回 {id_card: user_id}，调用方负责提交事务
+    """
+    return _write_users(values, update=False)
+
+def login_user(values):
+    """
+    登录时写入单个用户，返回 (user_id, 是否写入)
+    资料未变化时只有一次按唯一索引的只读查询；新用户或资料变化时执行一条 upsert 并由 RETURNING 带回 id
+    """
+    current = db.session.execute(
+        select(User.id, *(getattr(User, field) for field in USER_FIELDS)).where(User.id_card == values["id_card"])
+    ).first()
+    if current and all(getattr(current, field) == values[field] for field in USER_FIELDS):
+        return current.id, False
+    return upsert_users([values])[values["id_card"]], True
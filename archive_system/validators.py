@@ -1,56 +1,109 @@
 import re
-from datetime import datetime
+from datetime import datetime, date
 
-def validate_id_card(id_code):
-    """
-    校验中国大陆身份证 (18位) 及 港澳台居民居住证
-    算法：ISO 7064:1983.MOD 11-2
-    """
+try:
+    import numpy as np  # 可选依赖：批量校验时用于向量化计算校验码
+except ImportError:
+    np = None
+
+# 预编译的格式规则
+ID_CARD_PATTERN = re.compile(r'^\d{17}[\dX]$', re.ASCII)
+HK_MACAO_PATTERN = re.compile(r'^[HM]\d{8,10}$')
+TAIWAN_PATTERN = re.compile(r'^\d{8}$')
+FOREIGNER_OLD_PATTERN = re.compile(r'^[A-Z]{3}\d{12}$')
+PASSPORT_PATTERN = re.compile(r'^[A-Z0-9]{5,20}$')
+PHONE_PATTERN = re.compile(r'^1[3-9]\d{9}$')
+
+# ISO 7064:1983.MOD 11-2 加权因子与校验码表（余数 -> 校验位）
+ID_FACTORS = (7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2)
+ID_PARITY = "10X98765432"
+# 以 ASCII 码直接加权求和时需要扣除的 '0' 偏移量
+_ASCII_OFFSET = ord("0") * sum(ID_FACTORS)
+
+# 省级行政区划代码（GB/T 2260 前两位）；83 为台湾居民居住证（9 开头的新版外国人永久居留身份证单独处理）
+REGION_CODES = frozenset({
+    "11", "12", "13", "14", "15",
+    "21", "22", "23",
+    "31", "32", "33", "34", "35", "36", "37",
+    "41", "42", "43", "44", "45", "46",
+    "50", "51", "52", "53", "54",
+    "61", "62", "63", "64", "65",
+    "71", "81", "82", "83",
+})
+
+# 走身份证算法的证件类型
+ID_CARD_TYPES = ('身份证', '港澳台居民居住证')
+# 新版（五星卡）为 9 开头的 18 位号码，同样走身份证算法
+FOREIGNER_CARD_TYPE = '外国人永久居留身份证'
+
+# 低于该数量时向量化的额外开销不划算，直接逐条计算
+NUMPY_MIN_BATCH = 256
+
+def _check_region(id_code, cert_type):
+    """9 开头只对外国人永久居留身份证有效，其余证件须以省级行政区划代码开头"""
+    if cert_type == FOREIGNER_CARD_TYPE:
+        return id_code[0] == "9"
+    return id_code[:2] in REGION_CODES
+
+def _check_birth(id_code, today):
+    """生日校验：直接按位解析，避免 strptime 的格式解析开销"""
+    try:
+        birth_date = date(int(id_code[6:10]), int(id_code[10:12]), int(id_code[12:14]))
+    except ValueError:
+        return False, "出生日期非法"
+    if birth_date > today or birth_date.year < 1900:
+        return False, "出生日期无效"
+    return True, None
+
+def _id_parity(id_code):
+    """计算校验位：对前 17 位的 ASCII 码加权求和后扣除偏移量，再查表"""
+    total = sum(map(int.__mul__, ID_FACTORS, id_code[:17].encode())) - _ASCII_OFFSET
+    return ID_PARITY[total % 11]
+
+def _validate_id_card(id_code, today, parity=None, cert_type='身份证'):
     if len(id_code) != 18:
         return False, "长度必须为18位"
 
     # 1. 格式校验 (前17位数字，最后一位数字或X)
-    if not re.match(r'^\d{17}[\dX]$', id_code):
+    if not ID_CARD_PATTERN.match(id_code):
         return False, "格式错误，包含非法字符"
 
-    # 2. 省份校验 (简单校验前两位是否在编码表中，此处略去庞大的字典，主要靠校验码)
-    
+    # 2. 地区校验 (前两位须为省级行政区划代码，外国人永久居留身份证为 9 开头)
+    if not _check_region(id_code, cert_type):
+        return False, "地区码无效"
+
     # 3. 生日日期校验
-    try:
-        birth_str = id_code[6:14]
-        birth_date = datetime.strptime(birth_str, '%Y%m%d')
-        if birth_date > datetime.now() or birth_date.year < 1900:
-            return False, "出生日期无效"
-    except ValueError:
-        return False, "出生日期非法"
+    ok, msg = _check_birth(id_code, today)
+    if not ok:
+        return False, msg
 
     # 4. 校验码计算 (核心算法)
-    factor = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
-    parity = ['1', '0', 'X', '9', '8', '7', '6', '5', '4', '3', '2']
-    
-    checksum = 0
-    for i in range(17):
-        checksum += int(id_code[i]) * factor[i]
-    
-    expected_last = parity[checksum % 11]
-    
-    if id_code[-1] != expected_last:
+    if parity is None:
+        parity = _id_parity(id_code)
+    if id_code[-1] != parity:
         return False, "身份证校验位错误（可能是假号或输入错误）"
-        
+
     return True, "校验通过"
 
+def validate_id_card(id_code, cert_type='身份证'):
+    """
+    校验中国大陆身份证 (18位) 及 港澳台居民居住证、新版外国人永久居留身份证
+    算法：ISO 7064:1983.MOD 11-2
+    """
+    return _validate_id_card(id_code, date.today(), cert_type=cert_type)
+
 def validate_certificate(cert_type, cert_no):
     """
     统一入口：根据证件类型分发校验逻辑
     """
     cert_no = cert_no.upper().strip() # 统一转大写，去空格
 
-    if cert_type in ['身份证', '港澳台居民居住证']:
+    if cert_type in ID_CARD_TYPES:
         return validate_id_card(cert_no)
     
     elif cert_type == '港澳居民来往内地通行证':
         # 规则：H或M开头 + 8位或10位数字 (部分旧版是10位)
-        if re.match(r'^[HM]\d{8,10}$', cert_no):
+        if HK_MACAO_PATTERN.match(cert_no):
             return True, "格式正确"
         return False, "格式应为 H/M + 8或10位数字"
 
@@ -58,16 +111,16 @@ def validate_certificate(cert_type, cert_no):
         # 规则：8位数字 (台胞证) 或 新版卡式可能带字母
         # 普遍规则：8位数字 或 1位字母+7位数字(极少) 
         # 这里采用较通用的 8位数字校验
-        if re.match(r'^\d{8}$', cert_no):
+        if TAIWAN_PATTERN.match(cert_no):
             return True, "格式正确"
         return False, "格式应为 8位数字"
 
-    elif cert_type == '外国人永久居留身份证':
+    elif cert_type == FOREIGNER_CARD_TYPE:
         # 旧版：15位 (3字母+12数字)
         # 新版(五星卡)：18位 (9开头，算法同身份证)
         if len(cert_no) == 18 and cert_no.startswith('9'):
-            return validate_id_card(cert_no) # 复用身份证算法
-        elif re.match(r'^[A-Z]{3}\d{12}$', cert_no):
+            return validate_id_card(cert_no, cert_type) # 复用身份证算法
+        elif FOREIGNER_OLD_PATTERN.match(cert_no):
             return True, "格式正确"
         return False, "格式不正确"
 
@@ -75,12 +128,63 @@ def validate_certificate(cert_type, cert_no):
         # 护照规则复杂，全球标准不一。
         # 中国护照通常是 E/G/E + 数字，外国护照长度不一
         # 策略：宽松校验，长度5-20位，只含数字和字母
-        if re.match(r'^[A-Z0-9]{5,20}$', cert_no):
+        if PASSPORT_PATTERN.match(cert_no):
             return True, "格式正确"
         return False, "护照号码格式异常"
     
     return True, "未知证件类型，跳过校验"
 
+def _uses_id_algorithm(cert_type, cert_no):
+    if cert_type in ID_CARD_TYPES:
+        return True
+    return cert_type == FOREIGNER_CARD_TYPE and len(cert_no) == 18 and cert_no.startswith('9')
+
+def _batch_parities(codes, use_numpy):
+    """批量计算校验位；格式不合法的号码对应 None（校验时会先在格式一步失败）"""
+    wellformed = [i for i, code in enumerate(codes) if ID_CARD_PATTERN.match(code)]
+    parities = [None] * len(codes)
+    if not wellformed:
+        return parities
+
+    if use_numpy:
+        # 拼成 (n, 18) 的 ASCII 矩阵，一次矩阵乘法算出全部加权和
+        buf = "".join(codes[i] for i in wellformed).encode("ascii")
+        digits = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 18)[:, :17].astype(np.int64)
+        remainders = (digits @ np.array(ID_FACTORS, dtype=np.int64) - _ASCII_OFFSET) % 11
+        for i, remainder in zip(wellformed, remainders.tolist()):
+            parities[i] = ID_PARITY[remainder]
+    else:
+        for i in wellformed:
+            parities[i] = _id_parity(codes[i])
+    return parities
+
+def validate_certificates_batch(rows, use_numpy=None):
+    """
+    批量校验证件号码（团体名单导入等场景）
+    参数: rows - 可迭代的 (cert_type, cert_no)
+          use_numpy - 是否用 NumPy 向量化计算校验码，默认在已安装且数量较多时启用
+    返回: 与输入一一对应的 (is_valid, message) 列表，结果与逐条调用 validate_certificate 一致
+    """
+    rows = [(cert_type, (cert_no or "").upper().strip()) for cert_type, cert_no in rows]
+    id_indexes = [i for i, (cert_type, cert_no) in enumerate(rows) if _uses_id_algorithm(cert_type, cert_no)]
+
+    if use_numpy is None:
+        use_numpy = np is not None and len(id_indexes) >= NUMPY_MIN_BATCH
+    elif use_numpy and np is None:
+        raise RuntimeError("未安装 numpy，无法使用向量化校验")
+
+    parities = _batch_parities([rows[i][1] for i in id_indexes], use_numpy)
+    parity_of = dict(zip(id_indexes, parities))
+
+    today = date.today()
+    results = []
+    for i, (cert_type, cert_no) in enumerate(rows):
+        if i in parity_of:
+            results.append(_validate_id_card(cert_no, today, parity_of[i], cert_type))
+        else:
+            results.append(validate_certificate(cert_type, cert_no))
+    return results
+
 def validate_phone(phone):
     """
     校验中国大陆手机号
@@ -96,7 +200,7 @@ def validate_phone(phone):
     # ^1      : 以1开头
     # [3-9]   : 第二位必须是3到9之间的数字
     # \d{9}$  : 后面紧跟9个数字，直到结束
-    if not re.match(r'^1[3-9]\d{9}$', phone):
+    if not PHONE_PATTERN.match(phone):
         return False, "请输入有效的11位手机号码"
         
     return True, "校验通过"
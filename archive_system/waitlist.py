@@ -0,0 +1,151 @@
+"""
+时段候补队列
+名额已满时访客可加入候补（每人每个时段一条记录），不必反复重试提交。
+预约被拒绝或取消而释放名额时，在同一事务中按排队顺序把队首转为待审核预约并写入通知。
+取队首走 (校区, 日期, 时段, 状态, id) 索引，代价为 O(log n)。
+"""
+from datetime import date, datetime
+from sqlalchemy import update
+from .extensions import db
+from .models import Reservation, WaitlistEntry
+from .capacity import acquire_slot, release_slot
+from .counters import bump_status
+from .stats import record_new_reservation
+from .notify import enqueue
+from .cache import get_config
+
+WAITING = "waiting"
+PROMOTED = "promoted"
+CANCELLED = "cancelled"
+
+def _slot_filter(area, visit_date, visit_time):
+    return (
+        WaitlistEntry.area == area,
+        WaitlistEntry.visit_date == visit_date,
+        WaitlistEntry.visit_time == visit_time,
+    )
+
+def join_waitlist(user_id, area, visit_date, visit_time, reason=None, res_type=None, identity=None):
+    """在当前事务中加入候补队列（不提交）；同一时段重复排队会在提交时被唯一索引拦截"""
+    entry = WaitlistEntry(
+        user_id=user_id,
+        area=area,
+        visit_date=visit_date,
+        visit_time=visit_time,
+        reason=reason,
+        res_type=res_type,
+        identity=identity,
+        active_key=Reservation.make_active_key(user_id, visit_date, visit_time),
+    )
+    db.session.add(entry)
+    return entry
+
+def queue_position(entry):
+    """排队位置（从 1 开始）"""
+    return (
+        WaitlistEntry.query.filter(
+            *_slot_filter(entry.area, entry.visit_date, entry.visit_time),
+            WaitlistEntry.status == WAITING,
+            WaitlistEntry.id <= entry.id,
+        ).count()
+    )
+
+def waiting_entries(user_id):
+    """用户仍在排队中的候补记录（参观日期未过）"""
+    return (
+        WaitlistEntry.query.filter(
+            WaitlistEntry.user_id == user_id,
+            WaitlistEntry.status == WAITING,
+            WaitlistEntry.visit_date >= date.today(),
+        )
+        .order_by(WaitlistEntry.created_at.desc())
+        .all()
+    )
+
+def _take(entry_id, status, **values):
+    """条件更新让候补记录出队，并发释放名额时每条候补只会被处理一次"""
+    return db.session.execute(
+        update(WaitlistEntry)
+        .where(WaitlistEntry.id == entry_id, WaitlistEntry.status == WAITING)
+        .values(status=status, active_key=None, **values)
+        .execution_options(synchronize_session=False)
+    ).rowcount == 1
+
+def leave_waitlist(entry_id, user_id):
+    """访客主动退出候补；返回是否成功"""
+    entry = db.session.get(WaitlistEntry, entry_id)
+    if entry is None or entry.user_id != user_id:
+        return False
+    return _take(entry_id, CANCELLED)
+
+def promote_waiters(area, visit_date, visit_time, count=1):
+    """
+    名额释放后在当前事务中按排队顺序让候补者转为待审核预约，最多 count 人
+    返回新建的预约列表（调用方提交后据此更新余量日历）
+    """
+    if count <= 0 or visit_date < date.today():
+        return []
+
+    limit = get_config().daily_limit
+    promoted = []
+    last_id = 0
+    holding_slot = False
+    while len(promoted) < count:
+        entry = (
+            WaitlistEntry.query.filter(
+                *_slot_filter(area, visit_date, visit_time),
+                WaitlistEntry.status == WAITING,
+                WaitlistEntry.id > last_id,
+            )
+            .order_by(WaitlistEntry.id)
+            .first()
+        )
+        if entry is None:
+            break
+        last_id = entry.id
+
+        # 候补者已通过其他途径预约了该时段：直接出队
+        active_key = Reservation.make_active_key(entry.user_id, visit_date, visit_time)
+        if Reservation.query.filter_by(active_key=active_key).with_entities(Reservation.id).first():
+            _take(entry.id, CANCELLED)
+            continue
+
+        if not holding_slot:
+            if not acquire_slot(area, visit_date, visit_time, limit):
+                break
+            holding_slot = True
+        if not _take(entry.id, PROMOTED, promoted_at=datetime.now()):
+            continue
+
+        res = Reservation(
+            user_id=entry.user_id,
+            area=area,
+            visit_date=visit_date,
+            visit_time=visit_time,
+            reason=entry.reason,
+            res_type=entry.res_type,
+            identity=entry.identity,
+            active_key=active_key,
+        )
+        db.session.add(res)
+        db.session.flush()
+        db.session.execute(
+            update(WaitlistEntry)
+            .where(WaitlistEntry.id == entry.id)
+            .values(reservation_id=res.id)
+            .execution_options(synchronize_session=False)
+        )
+        bump_status("待审核")
+        record_new_reservation(res)
+        enqueue(
+            "promoted",
+            entry.user_id,
+            f"您候补的 {visit_date.isoformat()} {visit_time}（{area}）已有空余名额，已自动提交预约，等待审核。",
+            reservation=res,
+        )
+        holding_slot = False
+        promoted.append(res)
+
+    if holding_slot:
+        release_slot(area, visit_date, visit_time)
+    return promoted
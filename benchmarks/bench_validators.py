@@ -0,0 +1,153 @@
+"""
+证件批量校验基准测试
+
+以优化前的实现（逐条 re.match + strptime + 循环求和）为参照，对比逐条调用 validate_certificate
+与 validate_certificates_batch（纯 Python / NumPy）的吞吐量。
+用法：python benchmarks/bench_validators.py [--rows 100000] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from archive_system import validators  # noqa: E402
+from archive_system.validators import (  # noqa: E402
+    ID_FACTORS, ID_PARITY, REGION_CODES, validate_certificate, validate_certificates_batch,
+)
+
+
+# ---- 优化前的实现（原样保留，作为对照基线）----
+
+def legacy_validate_id_card(id_code):
+    if len(id_code) != 18:
+        return False, "长度必须为18位"
+
+    if not re.match(r'^\d{17}[\dX]$', id_code):
+        return False, "格式错误，包含非法字符"
+
+    try:
+        birth_str = id_code[6:14]
+        birth_date = datetime.strptime(birth_str, '%Y%m%d')
+        if birth_date > datetime.now() or birth_date.year < 1900:
+            return False, "出生日期无效"
+    except ValueError:
+        return False, "出生日期非法"
+
+    factor = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
+    parity = ['1', '0', 'X', '9', '8', '7', '6', '5', '4', '3', '2']
+
+    checksum = 0
+    for i in range(17):
+        checksum += int(id_code[i]) * factor[i]
+
+    expected_last = parity[checksum % 11]
+
+    if id_code[-1] != expected_last:
+        return False, "身份证校验位错误（可能是假号或输入错误）"
+
+    return True, "校验通过"
+
+
+def legacy_validate_certificate(cert_type, cert_no):
+    cert_no = cert_no.upper().strip()
+
+    if cert_type in ['身份证', '港澳台居民居住证']:
+        return legacy_validate_id_card(cert_no)
+
+    elif cert_type == '港澳居民来往内地通行证':
+        if re.match(r'^[HM]\d{8,10}$', cert_no):
+            return True, "格式正确"
+        return False, "格式应为 H/M + 8或10位数字"
+
+    elif cert_type == '台湾居民来往大陆通行证':
+        if re.match(r'^\d{8}$', cert_no):
+            return True, "格式正确"
+        return False, "格式应为 8位数字"
+
+    elif cert_type == '外国人永久居留身份证':
+        if len(cert_no) == 18 and cert_no.startswith('9'):
+            return legacy_validate_id_card(cert_no)
+        elif re.match(r'^[A-Z]{3}\d{12}$', cert_no):
+            return True, "格式正确"
+        return False, "格式不正确"
+
+    elif cert_type == '护照':
+        if re.match(r'^[A-Z0-9]{5,20}$', cert_no):
+            return True, "格式正确"
+        return False, "护照号码格式异常"
+
+    return True, "未知证件类型，跳过校验"
+
+
+def make_id_card(rng):
+    region = rng.choice(sorted(REGION_CODES)) + "%04d" % rng.randrange(10000)
+    birth = date(1950, 1, 1) + timedelta(days=rng.randrange(365 * 60))
+    body = region + birth.strftime("%Y%m%d") + "%03d" % rng.randrange(1000)
+    return body + ID_PARITY[sum(int(c) * f for c, f in zip(body, ID_FACTORS)) % 11]
+
+
+def make_rows(n, seed=42):
+    """约 80% 身份证（其中一成校验位错误），其余为其他证件类型"""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        kind = rng.random()
+        if kind < 0.8:
+            code = make_id_card(rng)
+            if rng.random() < 0.1:
+                code = code[:-1] + ("0" if code[-1] != "0" else "1")
+            rows.append(("身份证", code))
+        elif kind < 0.9:
+            rows.append(("港澳居民来往内地通行证", "H%08d" % rng.randrange(10 ** 8)))
+        else:
+            rows.append(("护照", "E%08d" % rng.randrange(10 ** 8)))
+    return rows
+
+
+def best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    cases = [
+        # 生成的号码地区码均有效，旧实现不校验地区码也不影响结果一致性
+        ("优化前 (re.match + strptime)", lambda: [legacy_validate_certificate(t, n) for t, n in rows]),
+        ("逐条 validate_certificate", lambda: [validate_certificate(t, n) for t, n in rows]),
+        ("批量 (纯 Python)", lambda: validate_certificates_batch(rows, use_numpy=False)),
+    ]
+    if validators.np is not None:
+        cases.append(("批量 (NumPy)", lambda: validate_certificates_batch(rows, use_numpy=True)))
+    else:
+        print("未安装 numpy，跳过向量化测试")
+
+    baseline = None
+    expected = None
+    print(f"{'方式':<28}{'耗时(s)':>10}{'行/秒':>14}{'加速比':>8}")
+    for label, func in cases:
+        elapsed, result = best_of(args.repeat, func)
+        if expected is None:
+            baseline, expected = elapsed, result
+        elif result != expected:
+            raise SystemExit(f"{label} 的结果与优化前的实现不一致")
+        print(f"{label:<28}{elapsed:>10.3f}{args.rows / elapsed:>14,.0f}{baseline / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+"""
+预约高峰压测
+
+在预置数据的 SQLite 文件上运行 create_app()，模拟热门展览开放预约时的场景：
+- N 个访客并发执行 登录 -> 打开预约页 -> 提交预约 -> 查看预约记录（约一半是已注册的老用户）
+- 同时若干管理员不断翻页浏览管理后台并审核待审核预约
+统计每类请求的 p50/p95/p99 延迟、吞吐量、每请求 SQL 语句数、数据库锁冲突错误数，
+默认重复运行 3 轮（每轮重新建库），各指标取中位数以降低抖动；
+可保存为 JSON 基线，之后的运行与基线对比，出现性能回退时以非零状态码退出。
+
+用法：
+    python benchmarks/booking_rush.py --save-baseline benchmarks/baseline.json
+    python benchmarks/booking_rush.py --compare benchmarks/baseline.json
+"""
+import argparse
+import html
+import json
+import os
+import random
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import got_request_exception  # noqa: E402
+from sqlalchemy import event, insert  # noqa: E402
+
+from archive_system import create_app, init_db  # noqa: E402
+from archive_system.capacity import rebuild_capacity  # noqa: E402
+from archive_system.config import Config, ProductionConfig, engine_options  # noqa: E402
+from archive_system.counters import rebuild_status_counters  # noqa: E402
+from archive_system.extensions import db  # noqa: E402
+from archive_system.models import Reservation, SystemConfig, User  # noqa: E402
+from archive_system.search import rebuild_user_index  # noqa: E402
+from archive_system.stats import rebuild_daily_stats  # noqa: E402
+from bench_validators import make_id_card  # noqa: E402
+
+AREAS = ("主校区", "新校区")
+TIMES = ("09:00-11:00", "14:00-16:00")
+STATUSES = ("待审核", "已同意", "已拒绝")
+KEY_PATTERN = re.compile(r'name="idempotency_key" value="(\w+)"')
+PENDING_ID_PATTERN = re.compile(r'batch-check" value="(\d+)"')
+# 可用的"下一页"链接（带 after 游标），不可用时 li 带 disabled
+NEXT_PAGE_PATTERN = re.compile(r'<li class="page-item\s*">\s*<a class="page-link"\s*href="([^"]*after=[^"]*)"')
+# 管理员每轮顺着游标翻阅的页数
+ADMIN_PAGE_DEPTH = 5
+
+# 与基线对比时允许的回退幅度（相对值）
+LATENCY_TOLERANCE = 0.5
+# 毫秒级请求的相对抖动很大，延迟额外允许的绝对误差
+LATENCY_SLACK_MS = 10
+THROUGHPUT_TOLERANCE = 0.2
+SQL_TOLERANCE = 0.2
+
+
+def make_config(db_path, workdir, profile):
+    base = ProductionConfig if profile == "prod" else Config
+    uri = f"sqlite:///{db_path}"
+
+    class BenchConfig(base):
+        SECRET_KEY = "booking-rush"
+        SQLALCHEMY_DATABASE_URI = uri
+        SQLALCHEMY_ENGINE_OPTIONS = engine_options(uri)
+        CACHE_VERSION_FILE = os.path.join(workdir, "cache_version")
+        NOTIFY_SENDER = "fake"
+        CHECKIN_BACKGROUND = False
+
+    return BenchConfig
+
+
+def seed(app, users, reservations, daily_limit, rng):
+    """写入历史用户与预约，并重建名额台账、计数、检索索引与统计汇总"""
+    with app.app_context():
+        init_db()
+        db.session.execute(
+            insert(User),
+            [
+                {"id_type": "身份证", "id_card": make_id_card(rng), "name": f"访客{i}", "phone": f"138{i:08d}"}
+                for i in range(users)
+            ],
+        )
+        user_ids = [row.id for row in db.session.query(User.id).order_by(User.id)]
+        today = date.today()
+        rows = []
+        for i in range(reservations):
+            user_id = user_ids[i % len(user_ids)]
+            visit_date = today - timedelta(days=1 + i // len(user_ids))
+            visit_time = TIMES[i % 2]
+            status = rng.choice(STATUSES)
+            rows.append({
+                "user_id": user_id,
+                "area": AREAS[i % 2],
+                "visit_date": visit_date,
+                "visit_time": visit_time,
+                "reason": "历史预约",
+                "res_type": "个人",
+                "identity": "校外人员",
+                "status": status,
+                "created_at": datetime.combine(visit_date, datetime.min.time()),
+                "active_key": None if status == "已拒绝" else Reservation.make_active_key(user_id, visit_date, visit_time),
+            })
+        for start in range(0, len(rows), 5000):
+            db.session.execute(insert(Reservation), rows[start:start + 5000])
+        SystemConfig.query.first().daily_limit = daily_limit
+        db.session.commit()
+
+        rebuild_capacity()
+        rebuild_status_counters()
+        rebuild_user_index()
+        rebuild_daily_stats()
+        return db.session.query(User.id_card).order_by(User.id).limit(users).all()
+
+
+class Recorder:
+    """按操作名记录延迟、状态码与 SQL 语句数；SQL 通过引擎事件按线程归属到当前请求"""
+
+    def __init__(self):
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.statements = defaultdict(int)
+        self.codes = defaultdict(lambda: defaultdict(int))
+        self.lock_errors = 0
+        self.server_errors = 0
+
+    def on_sql(self, *args):
+        if getattr(self.local, "op", None):
+            self.local.statements += 1
+
+    def on_exception(self, sender, exception, **extra):
+        with self.lock:
+            if "database is locked" in str(exception):
+                self.lock_errors += 1
+
+    def call(self, op, func, *args, **kwargs):
+        self.local.op = op
+        self.local.statements = 0
+        start = time.perf_counter()
+        response = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        self.local.op = None
+        with self.lock:
+            self.latencies[op].append(elapsed)
+            self.statements[op] += self.local.statements
+            self.codes[op][response.status_code] += 1
+            if response.status_code >= 500:
+                self.server_errors += 1
+        return response
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(pct / 100 * len(values)) - 1))
+    return values[index]
+
+
+def visitor(app, recorder, identity, visit_dates, rng):
+    client = app.test_client()
+    client.environ_base["REMOTE_ADDR"] = f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}"
+    id_card, name, phone = identity
+    recorder.call("h5.login", client.post, "/h5/login",
+                  data={"id_type": "身份证", "id_card": id_card, "name": name, "phone": phone})
+    page = recorder.call("h5.reserve GET", client.get, "/h5/reserve")
+    match = KEY_PATTERN.search(page.get_data(as_text=True))
+    recorder.call("h5.reserve POST", client.post, "/h5/reserve", data={
+        "area": rng.choice(AREAS),
+        "visit_date": rng.choice(visit_dates).isoformat(),
+        "visit_time": rng.choice(TIMES),
+        "reason": "参观展览",
+        "res_type": "个人",
+        "identity": "校外人员",
+        "idempotency_key": match.group(1) if match else "",
+    })
+    recorder.call("h5.history", client.get, "/h5/history")
+
+
+def admin(app, recorder, done, rng):
+    client = app.test_client()
+    client.post("/admin/login", data={"username": "admin", "password": "admin"})
+    while not done.is_set():
+        page = recorder.call("admin.dashboard", client.get, "/admin/dashboard", query_string={"status": "待审核"})
+        pending = PENDING_ID_PATTERN.findall(page.get_data(as_text=True))
+        for res_id in rng.sample(pending, min(3, len(pending))):
+            action = "reject" if int(res_id) % 5 == 0 else "approve"
+            recorder.call("admin.audit", client.post, f"/admin/audit/{res_id}",
+                          data={"action": action, "reject_reason": "名额调整"})
+        # 顺着分页链接中的 next_cursor 翻页，覆盖真实的游标分页查询
+        for _ in range(ADMIN_PAGE_DEPTH):
+            match = NEXT_PAGE_PATTERN.search(page.get_data(as_text=True))
+            if not match:
+                break
+            page = recorder.call("admin.dashboard", client.get, html.unescape(match.group(1)))
+
+
+def run_round(args):
+    # 临时目录存放缓存版本文件（及默认的压测数据库），指定 --db 时也要清理
+    workdir = tempfile.mkdtemp(prefix="booking_rush_")
+    try:
+        return _run_round(args, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _run_round(args, workdir):
+    rng = random.Random(args.seed)
+    db_path = args.db or os.path.join(workdir, "bench.db")
+    for path in (db_path, db_path + "-wal", db_path + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+
+    app = create_app(make_config(db_path, workdir, args.profile))
+    existing = seed(app, args.seed_users, args.seed_reservations, args.daily_limit, rng)
+
+    identities = []
+    for i in range(args.visitors):
+        if i % 2 == 0 and existing:
+            id_card = existing[(i // 2) % len(existing)].id_card
+            identities.append((id_card, f"访客{(i // 2) % len(existing)}", f"138{(i // 2) % len(existing):08d}"))
+        else:
+            identities.append((make_id_card(rng), f"新访客{i}", f"139{i:08d}"))
+    # 热门展览：所有访客争抢开放后最近几天的名额
+    visit_dates = [date.today() + timedelta(days=offset) for offset in range(1, args.days + 1)]
+
+    recorder = Recorder()
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", recorder.on_sql)
+    got_request_exception.connect(recorder.on_exception, app)
+
+    done = threading.Event()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.admins) as admins:
+        admin_futures = [admins.submit(admin, app, recorder, done, random.Random(args.seed + n)) for n in range(args.admins)]
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            futures = [
+                pool.submit(visitor, app, recorder, identity, visit_dates, random.Random(args.seed * 1000 + n))
+                for n, identity in enumerate(identities)
+            ]
+            for future in futures:
+                future.result()
+        done.set()
+        for future in admin_futures:
+            future.result()
+    wall = time.perf_counter() - start
+
+    app.extensions["notify_dispatcher"].stop()
+    with app.app_context():
+        db.engine.dispose()
+
+    requests = sum(len(v) for v in recorder.latencies.values())
+    report = {
+        "wall_seconds": round(wall, 3),
+        "requests": requests,
+        "throughput": round(requests / wall, 2),
+        "lock_errors": recorder.lock_errors,
+        "server_errors": recorder.server_errors,
+        "ops": {},
+    }
+    for op, values in sorted(recorder.latencies.items()):
+        report["ops"][op] = {
+            "count": len(values),
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+            "sql_per_request": round(recorder.statements[op] / len(values), 2),
+            "status_codes": {str(code): count for code, count in sorted(recorder.codes[op].items())},
+        }
+    return report
+
+
+def run(args):
+    """运行多轮，数值指标取各轮中位数，错误数取最大值"""
+    rounds = [run_round(args) for _ in range(args.rounds)]
+    report = {
+        "params": {
+            "rounds": args.rounds,
+            "visitors": args.visitors,
+            "concurrency": args.concurrency,
+            "admins": args.admins,
+            "profile": args.profile,
+            "seed_users": args.seed_users,
+            "seed_reservations": args.seed_reservations,
+            "daily_limit": args.daily_limit,
+        },
+        "rounds": args.rounds,
+        "wall_seconds": round(statistics.median(r["wall_seconds"] for r in rounds), 3),
+        "requests": round(statistics.median(r["requests"] for r in rounds)),
+        "throughput": round(statistics.median(r["throughput"] for r in rounds), 2),
+        "lock_errors": max(r["lock_errors"] for r in rounds),
+        "server_errors": max(r["server_errors"] for r in rounds),
+        "ops": {},
+    }
+    for op in sorted({op for r in rounds for op in r["ops"]}):
+        samples = [r["ops"][op] for r in rounds if op in r["ops"]]
+        merged = {
+            key: round(statistics.median(sample[key] for sample in samples), 2)
+            for key in ("count", "p50_ms", "p95_ms", "p99_ms", "sql_per_request")
+        }
+        codes = defaultdict(int)
+        for sample in samples:
+            for code, count in sample["status_codes"].items():
+                codes[code] += count
+        merged["status_codes"] = dict(sorted(codes.items()))
+        report["ops"][op] = merged
+    return report
+
+
+def print_report(report):
+    print(f"{'请求':<18}{'次数':>6}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'SQL/次':>8}  状态码")
+    for op, stats in report["ops"].items():
+        codes = ", ".join(f"{code}×{count}" for code, count in stats["status_codes"].items())
+        print(f"{op:<18}{stats['count']:>6}{stats['p50_ms']:>10}{stats['p95_ms']:>10}"
+              f"{stats['p99_ms']:>10}{stats['sql_per_request']:>8}  {codes}")
+    print(f"共 {report['rounds']} 轮取中位数；每轮请求 {report['requests']}，耗时 {report['wall_seconds']}s，吞吐 {report['throughput']} 请求/秒，"
+          f"锁冲突 {report['lock_errors']}，5xx {report['server_errors']}")
+
+
+def compare(report, baseline):
+    """返回回退项列表；延迟、吞吐、SQL 语句数允许一定波动，错误数不允许增加"""
+    problems = []
+    if report["params"] != baseline["params"]:
+        problems.append(f"压测参数与基线不一致：{baseline['params']}")
+    if report["throughput"] < baseline["throughput"] * (1 - THROUGHPUT_TOLERANCE):
+        problems.append(f"吞吐 {report['throughput']} < 基线 {baseline['throughput']}")
+    for key in ("lock_errors", "server_errors"):
+        if report[key] > baseline[key]:
+            problems.append(f"{key} {report[key]} > 基线 {baseline[key]}")
+    for op, base in baseline["ops"].items():
+        current = report["ops"].get(op)
+        if current is None:
+            problems.append(f"{op} 未执行")
+            continue
+        for key in ("p50_ms", "p95_ms"):
+            if current[key] > base[key] * (1 + LATENCY_TOLERANCE) + LATENCY_SLACK_MS:
+                problems.append(f"{op} {key} {current[key]} > 基线 {base[key]}")
+        if current["sql_per_request"] > base["sql_per_request"] * (1 + SQL_TOLERANCE):
+            problems.append(f"{op} SQL/次 {current['sql_per_request']} > 基线 {base['sql_per_request']}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="预约高峰压测")
+    parser.add_argument("--visitors", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--admins", type=int, default=2)
+    parser.add_argument("--days", type=int, default=2, help="访客争抢的参观日期数")
+    parser.add_argument("--daily-limit", type=int, default=30)
+    parser.add_argument("--seed-users", type=int, default=2000)
+    parser.add_argument("--seed-reservations", type=int, default=20000)
+    parser.add_argument("--profile", choices=("dev", "prod"), default="prod")
+    parser.add_argument("--db", help="SQLite 文件路径（默认临时目录，会被覆盖）")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"基线已保存到 {args.save_baseline}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            problems = compare(report, json.load(f))
+        if problems:
+            print("性能回退：")
+            for problem in problems:
+                print(f"  - {problem}")
+            sys.exit(1)
+        print("与基线相比无回退")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+# gunicorn 生产部署配置：gunicorn -c gunicorn.conf.py wsgi:app
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("WEB_THREADS", 4))
+worker_class = "gthread"
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+# 每个 worker 独立创建数据库连接池与后台通知线程，不在 master 进程中预加载应用
+preload_app = False
+
+accesslog = "-"
+errorlog = "-"
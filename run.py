@@ -1,6 +1,9 @@
-from archive_system import create_app
+from archive_system import create_app, init_db
 
 app = create_app()
 
 if __name__ == "__main__":
+    # 开发服务器启动时自动建表；生产环境请先执行 flask init-db
+    with app.app_context():
+        init_db()
     app.run(debug=True, host="0.0.0.0", port=8000)
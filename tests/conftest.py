@@ -0,0 +1,23 @@
+import pytest
+
+from archive_system import create_app, init_db
+from archive_system.config import Config
+from archive_system.extensions import db
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    NOTIFY_BACKGROUND = False
+    CHECKIN_BACKGROUND = False
+    LIVE_POLL_INTERVAL = 0
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app(TestConfig)
+    app.config["CACHE_VERSION_FILE"] = str(tmp_path / "cache_version")
+    with app.app_context():
+        init_db()
+        yield app
+        db.session.remove()
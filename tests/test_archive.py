@@ -0,0 +1,25 @@
+from datetime import date, timedelta
+
+from archive_system.archive import archive_reservations
+from archive_system.extensions import db
+from archive_system.models import ArchivedReservation, Reservation, User
+
+
+def test_archived_ids_are_not_reused(app):
+    user = User(id_card="110105199001011234", name="张三", phone="13800000000")
+    db.session.add(user)
+    db.session.flush()
+    old = Reservation(user_id=user.id, area="主校区", visit_date=date.today() - timedelta(days=400),
+                      visit_time="09:00-11:00", status="已同意")
+    db.session.add(old)
+    db.session.commit()
+    archived_id = old.id
+
+    assert archive_reservations(365) == 1
+    new = Reservation(user_id=user.id, area="主校区", visit_date=date.today(),
+                      visit_time="09:00-11:00", status="待审核")
+    db.session.add(new)
+    db.session.commit()
+
+    assert db.session.get(ArchivedReservation, archived_id) is not None
+    assert new.id > archived_id
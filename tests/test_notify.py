@@ -0,0 +1,31 @@
+from datetime import date, timedelta
+
+from archive_system.audit import audit_reservations, enqueue_audit_notifications
+from archive_system.extensions import db
+from archive_system.models import NotificationOutbox, Reservation, User
+
+
+def _pending_reservations(count):
+    user = User(id_card="110105199001011234", name="张三", phone="13800000000")
+    db.session.add(user)
+    db.session.flush()
+    visit_date = date.today() + timedelta(days=1)
+    rows = [
+        Reservation(user_id=user.id, area="主校区", visit_date=visit_date,
+                    visit_time=f"slot-{i}", status="待审核")
+        for i in range(count)
+    ]
+    db.session.add_all(rows)
+    db.session.commit()
+    return [row.id for row in rows]
+
+
+def test_batch_audit_notifications_keep_reservation_id(app):
+    res_ids = _pending_reservations(3)
+
+    updated, _, _ = audit_reservations(res_ids, "approve")
+    enqueue_audit_notifications(updated, "approve")
+    db.session.commit()
+
+    rows = NotificationOutbox.query.filter_by(event="approved").all()
+    assert sorted(row.reservation_id for row in rows) == sorted(res_ids)
@@ -0,0 +1,6 @@
+# 生产环境入口，例如：
+#   gunicorn -c gunicorn.conf.py wsgi:app
+from archive_system import create_app
+from archive_system.config import ProductionConfig
+
+app = create_app(ProductionConfig)